@@ -2,6 +2,7 @@ from typing import List, Optional
 from telegram import Update
 from src.config import ConfigManager
 from src.database.db_manager import DatabaseManager
+from src.models.database_schema import UserStatus
 from functools import wraps
 
 class AuthManager:
@@ -18,7 +19,7 @@ class AuthManager:
     def is_approved_participant(self, user_id: int) -> bool:
         """Check if user is an approved participant"""
         participant = self.db_manager.get_participant(user_id)
-        return participant is not None and participant.status == "approved"
+        return participant is not None and participant.status is UserStatus.APPROVED
     
     def is_registered(self, user_id: int) -> bool:
         """Check if user is registered (any status)"""
@@ -28,12 +29,11 @@ class AuthManager:
         """Get user's role"""
         if self.is_admin(user_id):
             return "admin"
-        elif self.is_approved_participant(user_id):
-            return "participant"
-        elif self.is_registered(user_id):
-            return "pending"
-        else:
+        
+        participant = self.db_manager.get_participant(user_id)
+        if participant is None:
             return "unregistered"
+        return "participant" if participant.status is UserStatus.APPROVED else "pending"
 
 def admin_required(func):
     """Decorator to require admin privileges for a command"""
@@ -52,14 +52,16 @@ def admin_required(func):
     return wrapper
 
 def participant_required(func):
-    """Decorator to require approved participant status for a command"""
+    """Decorator to require approved participant status for a command (admins always pass)"""
     @wraps(func)
     async def wrapper(self, update: Update, context, *args, **kwargs):
-        db_manager = context.bot_data.get('db_manager')
-        user_id = update.effective_user.id
+        # Admins take part in the rotation too; skip the participant lookup for them
+        config_manager = context.bot_data.get('config_manager')
+        if config_manager and config_manager.is_admin(update.effective_user.id):
+            return await func(self, update, context, *args, **kwargs)
         
-        participant = db_manager.get_participant(user_id)
-        if not participant or participant.status != "approved":
+        db_manager = context.bot_data.get('db_manager')
+        if not db_manager.has_status(update.effective_user.id, UserStatus.APPROVED):
             await update.message.reply_text(
                 "❌ This command is only available to approved participants."
             )
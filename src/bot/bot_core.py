@@ -1,21 +1,28 @@
 import logging
 import asyncio
+import signal
+from concurrent.futures import ThreadPoolExecutor
 from telegram import Update, Bot
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters
-from src.config import ConfigManager
-from src.database.db_manager import DatabaseManager
+from src.config import get_config_manager
+from src.database.db_manager import get_db_manager
 from src.schedule.scheduler import WeeklyScheduler
+from src.handlers.signup_handler import SignupHandler
+from src.handlers.admin_commands import AdminCommandHandler
+from src.handlers.callback_handlers import CallbackHandler
+from src.handlers.help_handler import HelpHandler
 from typing import Optional
 
 class HappyHourDutyBot:
     """Main bot class that coordinates all bot functionality"""
     
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.config = self.config_manager.get_bot_config()
-        self.db_manager = DatabaseManager(self.config.database_file_path)
+        self.db_manager = get_db_manager(self.config.database_file_path)
         self.application: Optional[Application] = None
         self.scheduler: Optional[WeeklyScheduler] = None
+        self._stop_event = asyncio.Event()
         
         # Configure logging
         logging.basicConfig(
@@ -28,8 +35,8 @@ class HappyHourDutyBot:
         """Set up the bot application and handlers"""
         self.logger.info("Setting up Happy Hour Duty Bot...")
         
-        # Create application with proper async context
-        self.application = Application.builder().token(self.config.bot_token).build()
+        # Create application with proper async context; updates from different users are handled concurrently
+        self.application = Application.builder().token(self.config.bot_token).concurrent_updates(True).build()
         
         # Initialize scheduler
         self.scheduler = WeeklyScheduler(self.application, self.config, self.db_manager)
@@ -39,6 +46,8 @@ class HappyHourDutyBot:
         self.application.bot_data['config_manager'] = self.config_manager
         self.application.bot_data['db_manager'] = self.db_manager
         self.application.bot_data['scheduler'] = self.scheduler
+        self.application.bot_data['notifier'] = self.scheduler.notification_manager
+        self.application.bot_data['rotation_manager'] = self.scheduler.rotation_manager
         
         # Register handlers
         self._register_handlers()
@@ -53,46 +62,54 @@ class HappyHourDutyBot:
     
     def _register_handlers(self):
         """Register all command and message handlers"""
-        from src.handlers.signup_handler import SignupHandler
-        from src.handlers.admin_commands import AdminCommandHandler
-        from src.handlers.callback_handlers import CallbackHandler
-        from src.handlers.help_handler import HelpHandler
-        
         # Initialize handlers
         signup_handler = SignupHandler()
         admin_handler = AdminCommandHandler()
         callback_handler = CallbackHandler()
         help_handler = HelpHandler()
         
-        # Register basic command handlers (these have priority)
-        self.application.add_handler(CommandHandler("start", signup_handler.start_command))
-        self.application.add_handler(CommandHandler("help", help_handler.help_command))
-        
-        # Register admin command handlers
-        self.application.add_handler(CommandHandler("admin_status", admin_handler.admin_status))
-        self.application.add_handler(CommandHandler("adjust_date", admin_handler.adjust_date))
-        self.application.add_handler(CommandHandler("assign", admin_handler.assign))
-        self.application.add_handler(CommandHandler("remove_user", admin_handler.remove_user))
-        self.application.add_handler(CommandHandler("list_users", admin_handler.list_users))
-        
-        # Additional admin commands for testing
-        self.application.add_handler(CommandHandler("trigger_weekly", admin_handler.trigger_weekly))
-        self.application.add_handler(CommandHandler("reset_round", admin_handler.reset_round))
-        
-        # Register callback query handler for inline buttons
-        self.application.add_handler(CallbackQueryHandler(callback_handler.handle_callback))
-        
-        # Register message handler for text messages (this should be last to avoid conflicts)
-        self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, signup_handler.handle_message)
-        )
+        self.application.add_handlers([
+            # Basic command handlers (these have priority)
+            CommandHandler("start", signup_handler.start_command),
+            CommandHandler("help", help_handler.help_command),
+            
+            # Admin command handlers
+            CommandHandler("admin_status", admin_handler.admin_status),
+            CommandHandler("adjust_date", admin_handler.adjust_date),
+            CommandHandler("assign", admin_handler.assign),
+            CommandHandler("remove_user", admin_handler.remove_user),
+            CommandHandler("list_users", admin_handler.list_users),
+            
+            # Additional admin commands for testing
+            CommandHandler("trigger_weekly", admin_handler.trigger_weekly),
+            CommandHandler("reset_round", admin_handler.reset_round),
+            
+            # Callback query handler for inline buttons
+            CallbackQueryHandler(callback_handler.handle_callback),
+            
+            # Message handler for text messages (this should be last to avoid conflicts)
+            MessageHandler(filters.TEXT & ~filters.COMMAND, signup_handler.handle_message),
+        ])
         
         self.logger.info("All handlers registered successfully")
     
     async def run(self):
         """Start the bot and keep it running"""
+        loop = asyncio.get_running_loop()
+        
+        # Database writes run via asyncio.to_thread; keep that pool small since they share one file
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=4, thread_name_prefix="db"))
+        
         await self.setup()
         
+        # Wake up only when asked to stop instead of polling for it
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._stop_event.set)
+            except NotImplementedError:
+                # Not supported on Windows; Ctrl-C still raises KeyboardInterrupt
+                pass
+        
         try:
             # Start the application
             await self.application.start()
@@ -101,13 +118,13 @@ class HappyHourDutyBot:
             self.logger.info("Happy Hour Duty Bot is running...")
             
             # Keep the bot running until interrupted
-            while True:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
+            self.logger.info("Stop signal received")
                 
         except KeyboardInterrupt:
             self.logger.info("Bot stopped by user")
         except Exception as e:
-            self.logger.error(f"Error running bot: {e}", exc_info=True)
+            self.logger.error("Error running bot: %s", e, exc_info=True)
         finally:
             await self.shutdown()
     
@@ -119,6 +136,9 @@ class HappyHourDutyBot:
             self.scheduler.shutdown()
         
         if self.application:
+            # Polling must be stopped first or application.shutdown() refuses to run
+            if self.application.updater and self.application.updater.running:
+                await self.application.updater.stop()
             await self.application.stop()
             await self.application.shutdown()
         
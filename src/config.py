@@ -1,14 +1,15 @@
-import json
 import os
-from typing import List, Dict, Any
+import orjson
+from typing import FrozenSet, Dict, Any, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 
 @dataclass
 class BotConfig:
     """Bot configuration settings"""
     bot_token: str
-    admin_ids: List[int]
+    admin_ids: FrozenSet[int]
     notification_time: str
     response_window_hours: int
     database_file_path: str
@@ -16,6 +17,54 @@ class BotConfig:
     default_meeting_day: str
     notification_day: str
     environment: str
+    min_poll_interval_minutes: float = 5
+    max_poll_interval_minutes: float = 120
+    poll_backoff_factor: float = 2.0
+    
+    def __post_init__(self):
+        self.admin_ids = frozenset(self.admin_ids)
+
+@lru_cache(maxsize=1)
+def _compute_defaults() -> Dict[str, Any]:
+    """
+    Build the environment-derived default configuration once per process.
+    Computed on first use rather than at import so .env has been loaded.
+    """
+    # Parse admin IDs from environment variable
+    admin_ids_str = os.getenv("ADMIN_IDS", "")
+    admin_ids = []
+    if admin_ids_str:
+        try:
+            # Support comma-separated list: "123456789,987654321"
+            admin_ids = [int(id.strip()) for id in admin_ids_str.split(",") if id.strip()]
+        except ValueError:
+            print("Warning: Invalid ADMIN_IDS format. Using empty list.")
+    
+    return {
+        "admin_ids": admin_ids,
+        "notification_time": os.getenv("NOTIFICATION_TIME", "10:00"),
+        "response_window_hours": int(os.getenv("RESPONSE_WINDOW_HOURS", "24")),
+        "database_file_path": os.getenv("DATABASE_PATH", "data/db.json"),
+        "timezone": os.getenv("TIMEZONE", "UTC"),
+        "default_meeting_day": os.getenv("MEETING_DAY", "Wednesday"),
+        "notification_day": os.getenv("NOTIFICATION_DAY", "Thursday"),
+        "min_poll_interval_minutes": float(os.getenv("MIN_POLL_INTERVAL_MINUTES", "5")),
+        "max_poll_interval_minutes": float(os.getenv("MAX_POLL_INTERVAL_MINUTES", "120")),
+        "poll_backoff_factor": float(os.getenv("POLL_BACKOFF_FACTOR", "2.0"))
+    }
+
+@lru_cache(maxsize=None)
+def _resolve_config_source(config_path: str) -> Optional[str]:
+    """Find which config file to load, checking the filesystem once per path"""
+    if os.path.exists(config_path):
+        return config_path
+    
+    # Fall back to the example config
+    example_path = "config.json.example"
+    if os.path.exists(example_path):
+        return example_path
+    
+    return None
 
 class ConfigManager:
     """Manages bot configuration from environment and config files"""
@@ -24,6 +73,8 @@ class ConfigManager:
         load_dotenv()
         self.config_path = config_path
         self.config_data = self._load_config_file()
+        self._admin_ids = frozenset(self.config_data.get("admin_ids", []))
+        self._bot_config: Optional[BotConfig] = None
         
     def _load_config_file(self) -> Dict[str, Any]:
         """Load configuration from CONFIG_JSON env var, JSON file, or use defaults"""
@@ -31,21 +82,17 @@ class ConfigManager:
         config_json = os.getenv('CONFIG_JSON')
         if config_json:
             try:
-                return json.loads(config_json)
-            except json.JSONDecodeError:
+                return orjson.loads(config_json)
+            except orjson.JSONDecodeError:
                 print("Warning: Failed to parse CONFIG_JSON environment variable")
 
-        # Try to load config file if environment variable not available
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        
-        # Try example config
-        example_path = "config.json.example"
-        if os.path.exists(example_path):
-            print(f"Warning: Using {example_path}. Please create {self.config_path}")
-            with open(example_path, 'r') as f:
-                return json.load(f)
+        # Try to load config file (or the example) if environment variable not available
+        config_source = _resolve_config_source(self.config_path)
+        if config_source:
+            if config_source != self.config_path:
+                print(f"Warning: Using {config_source}. Please create {self.config_path}")
+            with open(config_source, 'rb') as f:
+                return orjson.loads(f.read())
         
         # Use environment variables and defaults for Railway
         print("No config file found, using environment variables and defaults")
@@ -53,44 +100,38 @@ class ConfigManager:
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration for Railway deployment"""
-        # Parse admin IDs from environment variable
-        admin_ids_str = os.getenv("ADMIN_IDS", "")
-        admin_ids = []
-        if admin_ids_str:
-            try:
-                # Support comma-separated list: "123456789,987654321"
-                admin_ids = [int(id.strip()) for id in admin_ids_str.split(",") if id.strip()]
-            except ValueError:
-                print("Warning: Invalid ADMIN_IDS format. Using empty list.")
-        
-        return {
-            "admin_ids": admin_ids,
-            "notification_time": os.getenv("NOTIFICATION_TIME", "10:00"),
-            "response_window_hours": int(os.getenv("RESPONSE_WINDOW_HOURS", "24")),
-            "database_file_path": os.getenv("DATABASE_PATH", "data/db.json"),
-            "timezone": os.getenv("TIMEZONE", "UTC"),
-            "default_meeting_day": os.getenv("MEETING_DAY", "Wednesday"),
-            "notification_day": os.getenv("NOTIFICATION_DAY", "Thursday")
-        }
+        return dict(_compute_defaults())
     
     def get_bot_config(self) -> BotConfig:
-        """Get complete bot configuration"""
+        """Get complete bot configuration (built once, then reused)"""
+        if self._bot_config is not None:
+            return self._bot_config
+        
         bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
         if not bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN not found in environment variables")
         
-        return BotConfig(
+        self._bot_config = BotConfig(
             bot_token=bot_token,
-            admin_ids=self.config_data.get("admin_ids", []),
+            admin_ids=self._admin_ids,
             notification_time=self.config_data.get("notification_time", "10:00"),
             response_window_hours=self.config_data.get("response_window_hours", 24),
             database_file_path=self.config_data.get("database_file_path", "data/db.json"),
             timezone=self.config_data.get("timezone", "UTC"),
             default_meeting_day=self.config_data.get("default_meeting_day", "Wednesday"),
             notification_day=self.config_data.get("notification_day", "Thursday"),
-            environment=os.getenv("ENVIRONMENT", "development")
+            environment=os.getenv("ENVIRONMENT", "development"),
+            min_poll_interval_minutes=self.config_data.get("min_poll_interval_minutes", 5),
+            max_poll_interval_minutes=self.config_data.get("max_poll_interval_minutes", 120),
+            poll_backoff_factor=self.config_data.get("poll_backoff_factor", 2.0)
         )
+        return self._bot_config
     
     def is_admin(self, user_id: int) -> bool:
         """Check if a user ID is an admin"""
-        return user_id in self.config_data.get("admin_ids", [])
\ No newline at end of file
+        return user_id in self._admin_ids
+
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Get the process-wide ConfigManager instance"""
+    return ConfigManager()
\ No newline at end of file
@@ -1,12 +1,12 @@
-from src.database.db_manager import DatabaseManager
-from src.config import ConfigManager
+from src.database.db_manager import get_db_manager
+from src.config import get_config_manager
 
 def initialize_database():
     """Initialize the database with configuration"""
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     config = config_manager.get_bot_config()
     
-    db_manager = DatabaseManager(config.database_file_path)
+    db_manager = get_db_manager(config.database_file_path)
     print(f"Database initialized at: {config.database_file_path}")
     return db_manager
 
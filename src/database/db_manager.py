@@ -1,24 +1,52 @@
-import json
+import copy
 import os
-from typing import Dict, List, Optional, Any
+import orjson
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import lru_cache, wraps
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from datetime import datetime
-from threading import Lock
+from threading import Lock, RLock
 from src.models.database_schema import Participant, Schedule, UserStatus
 
+def _persists(method):
+    """Write out the snapshot a mutator queued once it has returned and released the lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._flush()
+        return result
+    return wrapper
+
 class DatabaseManager:
     """Manages file-based JSON database operations"""
     
     def __init__(self, db_path: str = "data/db.json"):
         self.db_path = db_path
-        self.lock = Lock()
+        # Re-entrant so public methods can hold it across nested writes; handlers call writers from worker threads
+        self.lock = RLock()
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # Writers serialize a snapshot under self.lock and queue it; the disk write happens outside it
+        # under _file_lock, so readers on the event loop never wait on an fsync
+        self._file_lock = Lock()
+        self._pending: Optional[Tuple[int, bytes]] = None
+        self._version = 0
+        self._written_version = 0
+        self._flushing = 0
+        self._mtime: Optional[int] = None
+        self._disk_mtime: Optional[int] = None
         self._ensure_database_exists()
+        self._load()
     
     def _ensure_database_exists(self):
         """Create database file if it doesn't exist"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         if not os.path.exists(self.db_path):
-            self._initialize_database()
+            with self.lock:
+                self._initialize_database()
+            self._flush()
     
     def _initialize_database(self):
         """Initialize empty database structure"""
@@ -41,109 +69,257 @@ class DatabaseManager:
         }
         self._write_db(initial_db)
     
-    def _read_db(self) -> Dict[str, Any]:
+    def _read_db_from_disk(self) -> Dict[str, Any]:
         """Read database from file"""
+        # No lock needed: writes swap the file in atomically via os.replace
+        with open(self.db_path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    def _load(self):
+        """Load the database from file into memory and rebuild the indexes"""
+        self._mtime = self._disk_mtime = os.stat(self.db_path).st_mtime_ns
+        self._cache = self._read_db_from_disk()
+        self._participant_objs: Dict[str, Participant] = {}
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self):
+        """Rebuild the participant status and rotation membership indexes from the in-memory database"""
+        # Dicts used as insertion-ordered sets of participant keys
+        self._idx_status: Dict[str, Dict[str, None]] = {}
+        for key, participant_data in self._cache["participants"].items():
+            self._idx_status.setdefault(participant_data["status"], {})[key] = None
+        
+        self._rotation_set = set(self._cache["schedule"]["rotation_list"])
+        self._skipped_set = set(self._cache["schedule"]["skipped_this_round"])
+    
+    def _index_status(self, key: str, old_status: Optional[str], new_status: Optional[str]):
+        """Move a participant key between status buckets"""
+        if old_status is not None:
+            self._idx_status.get(old_status, {}).pop(key, None)
+        if new_status is not None:
+            self._idx_status.setdefault(new_status, {})[key] = None
+    
+    def _get_participant_obj(self, key: str) -> Optional[Participant]:
+        """Get a copy of the deserialized participant for a database key, building it on first use"""
+        participant = self._participant_objs.get(key)
+        
+        if participant is None:
+            participant_data = self._cache["participants"].get(key)
+            if participant_data is None:
+                return None
+            participant = Participant.from_dict(participant_data)
+            self._participant_objs[key] = participant
+        
+        # Hand out a copy so callers changing fields before update_participant() can't touch the cache
+        return replace(participant)
+    
+    def _read_db(self) -> Dict[str, Any]:
+        """Return the in-memory database, reloading only if the file changed externally"""
+        # Under the writers' lock so a reload never races a write swapping the cache and indexes; our own
+        # queued or in-flight write moves the mtime too, so only look for external edits when none is
         with self.lock:
-            with open(self.db_path, 'r') as f:
-                return json.load(f)
+            if self._pending is None and not self._flushing and os.stat(self.db_path).st_mtime_ns != self._mtime:
+                self._load()
+            return self._cache
     
     def _write_db(self, data: Dict[str, Any]):
-        """Write database to file"""
+        """Update the in-memory database and queue a snapshot of it for _flush (call with self.lock held)"""
+        self._cache = data
+        
+        # Inside a batch the write is deferred until the batch ends
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        
+        data["metadata"]["last_modified"] = datetime.now().isoformat()
+        self._version += 1
+        self._pending = (self._version, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    
+    def _flush(self):
+        """Write the latest queued snapshot to disk without holding self.lock"""
         with self.lock:
-            data["metadata"]["last_modified"] = datetime.now().isoformat()
-            with open(self.db_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            pending, self._pending = self._pending, None
+            if pending is None:
+                return
+            self._flushing += 1
+        
+        try:
+            version, payload = pending
+            with self._file_lock:
+                # Another thread may already have written a newer snapshot
+                if version > self._written_version:
+                    # Write to a temp file and swap it in so the file is never half-written
+                    tmp_path = self.db_path + '.tmp'
+                    with open(tmp_path, 'wb') as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.db_path)
+                    self._written_version = version
+                    self._disk_mtime = os.stat(self.db_path).st_mtime_ns
+        finally:
+            with self.lock:
+                self._mtime = self._disk_mtime
+                self._flushing -= 1
+    
+    @contextmanager
+    def _batched(self):
+        """Collapse all writes made inside the block into a single write"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self._write_db(self._cache)
+    
+    @contextmanager
+    def schedule_transaction(self):
+        """Apply several schedule updates atomically, persisting them with a single write when the block ends"""
+        with self.lock, self._batched():
+            yield
+        self._flush()
     
     # Participant operations
+    @_persists
     def add_participant(self, participant: Participant) -> bool:
         """Add a new participant to the database"""
-        db = self._read_db()
-        
-        if str(participant.telegram_id) in db["participants"]:
-            return False
-        
-        db["participants"][str(participant.telegram_id)] = participant.to_dict()
-        self._write_db(db)
-        return True
+        with self.lock:
+            db = self._read_db()
+            
+            if str(participant.telegram_id) in db["participants"]:
+                return False
+            
+            db["participants"][str(participant.telegram_id)] = participant.to_dict()
+            self.invalidate_participant(participant.telegram_id)
+            self._index_status(str(participant.telegram_id), None, participant.status)
+            self._write_db(db)
+            return True
+    
+    def invalidate_participant(self, telegram_id: int):
+        """Drop a participant's cached object so the next read rebuilds it from the stored record"""
+        with self.lock:
+            self._participant_objs.pop(str(telegram_id), None)
     
     def get_participant(self, telegram_id: int) -> Optional[Participant]:
         """Get participant by telegram ID"""
-        db = self._read_db()
-        participant_data = db["participants"].get(str(telegram_id))
-        
-        if participant_data:
-            return Participant.from_dict(participant_data)
-        return None
+        with self.lock:
+            self._read_db()
+            return self._get_participant_obj(str(telegram_id))
     
-    def update_participant(self, participant: Participant) -> bool:
-        """Update existing participant"""
-        db = self._read_db()
-        
-        if str(participant.telegram_id) not in db["participants"]:
-            return False
-        
-        db["participants"][str(participant.telegram_id)] = participant.to_dict()
-        
-        # If status changed to approved, add to rotation
-        if participant.status == UserStatus.APPROVED.value:
-            if participant.telegram_id not in db["schedule"]["rotation_list"]:
-                db["schedule"]["rotation_list"].append(participant.telegram_id)
-        
-        self._write_db(db)
-        return True
+    @_persists
+    def update_participant(self, participant: Participant, expected_status: Optional[str] = None) -> bool:
+        """Update existing participant; with expected_status, only if the stored status still matches it"""
+        with self.lock:
+            db = self._read_db()
+            
+            key = str(participant.telegram_id)
+            if key not in db["participants"]:
+                return False
+            
+            old_status = db["participants"][key]["status"]
+            if expected_status is not None and old_status != expected_status:
+                return False
+            db["participants"][key] = participant.to_dict()
+            self.invalidate_participant(participant.telegram_id)
+            if old_status != participant.status:
+                self._index_status(key, old_status, participant.status)
+            
+            # If status changed to approved, add to rotation
+            if participant.status is UserStatus.APPROVED:
+                if participant.telegram_id not in self._rotation_set:
+                    db["schedule"]["rotation_list"].append(participant.telegram_id)
+                    self._rotation_set.add(participant.telegram_id)
+            
+            self._write_db(db)
+            return True
     
     def remove_participant(self, telegram_id: int) -> bool:
         """Remove participant from database"""
-        db = self._read_db()
-        
-        if str(telegram_id) not in db["participants"]:
-            return False
-        
-        del db["participants"][str(telegram_id)]
-        
-        # Remove from rotation list
-        if telegram_id in db["schedule"]["rotation_list"]:
-            db["schedule"]["rotation_list"].remove(telegram_id)
-            # Adjust pointer if necessary
-            if db["schedule"]["next_pointer_index"] >= len(db["schedule"]["rotation_list"]):
-                db["schedule"]["next_pointer_index"] = 0
-        
-        self._write_db(db)
-        return True
+        return self.pop_participant(telegram_id) is not None
+    
+    @_persists
+    def pop_participant(self, telegram_id: int) -> Optional[Participant]:
+        """Remove participant from database and return the removed record (None if not found)"""
+        with self.lock:
+            db = self._read_db()
+            
+            key = str(telegram_id)
+            if key not in db["participants"]:
+                return None
+            
+            removed = db["participants"].pop(key)
+            self.invalidate_participant(telegram_id)
+            self._index_status(key, removed["status"], None)
+            
+            # Remove from rotation list
+            if telegram_id in self._rotation_set:
+                db["schedule"]["rotation_list"].remove(telegram_id)
+                self._rotation_set.discard(telegram_id)
+                # Adjust pointer if necessary
+                if db["schedule"]["next_pointer_index"] >= len(db["schedule"]["rotation_list"]):
+                    db["schedule"]["next_pointer_index"] = 0
+            
+            self._write_db(db)
+            return Participant.from_dict(removed)
+    
+    def get_participants_by_ids(self, telegram_ids: Iterable[int]) -> Dict[int, Participant]:
+        """Get several participants at once, keyed by telegram ID (unknown IDs are left out)"""
+        with self.lock:
+            self._read_db()
+            participants = {}
+            
+            for telegram_id in telegram_ids:
+                participant = self._get_participant_obj(str(telegram_id))
+                if participant:
+                    participants[telegram_id] = participant
+            
+            return participants
     
     def get_all_participants(self, status: Optional[str] = None) -> List[Participant]:
         """Get all participants, optionally filtered by status"""
-        db = self._read_db()
-        participants = []
-        
-        for participant_data in db["participants"].values():
-            participant = Participant.from_dict(participant_data)
-            if status is None or participant.status == status:
-                participants.append(participant)
-        
-        return participants
+        with self.lock:
+            participants_data = self._read_db()["participants"]
+            
+            if status is None:
+                return [self._get_participant_obj(key) for key in participants_data]
+            
+            # Only materialize participants in the requested status bucket
+            return [self._get_participant_obj(key) for key in self._idx_status.get(status, {})]
+    
+    def has_status(self, telegram_id: int, status: str) -> bool:
+        """Check a participant's status from the status index without loading the participant"""
+        self._read_db()
+        return str(telegram_id) in self._idx_status.get(status, {})
     
     def get_pending_participants(self) -> List[Participant]:
         """Get all pending participants awaiting approval"""
-        return self.get_all_participants(status=UserStatus.PENDING.value)
+        return self.get_all_participants(status=UserStatus.PENDING)
     
     def get_approved_participants(self) -> List[Participant]:
         """Get all approved participants"""
-        return self.get_all_participants(status=UserStatus.APPROVED.value)
+        return self.get_all_participants(status=UserStatus.APPROVED)
     
     # Schedule operations
     def get_schedule(self) -> Schedule:
         """Get current schedule"""
-        db = self._read_db()
-        return Schedule.from_dict(db["schedule"])
+        with self.lock:
+            # Copy so callers mutating the returned lists don't touch the cache
+            return Schedule.from_dict(copy.deepcopy(self._read_db()["schedule"]))
     
+    @_persists
     def update_schedule(self, schedule: Schedule) -> bool:
         """Update schedule"""
-        db = self._read_db()
-        db["schedule"] = schedule.to_dict()
-        self._write_db(db)
-        return True
+        with self.lock:
+            db = self._read_db()
+            db["schedule"] = schedule.to_dict()
+            self._rotation_set = set(schedule.rotation_list)
+            self._skipped_set = set(schedule.skipped_this_round)
+            self._write_db(db)
+            return True
     
+    @_persists
     def get_next_assigned_participant(self) -> Optional[Participant]:
         """Get the next participant to be assigned"""
         schedule = self.get_schedule()
@@ -153,50 +329,113 @@ class DatabaseManager:
         
         if schedule.next_pointer_index >= len(schedule.rotation_list):
             schedule.next_pointer_index = 0
-            self.update_schedule(schedule)
+            self._patch_schedule(next_pointer_index=0)
         
         next_id = schedule.rotation_list[schedule.next_pointer_index]
         return self.get_participant(next_id)
     
+    def _patch_schedule(self, **fields) -> bool:
+        """Update schedule fields in place without a Schedule round-trip"""
+        with self.lock:
+            db = self._read_db()
+            db["schedule"].update(fields)
+            if "rotation_list" in fields:
+                self._rotation_set = set(fields["rotation_list"])
+            if "skipped_this_round" in fields:
+                self._skipped_set = set(fields["skipped_this_round"])
+            self._write_db(db)
+            return True
+    
+    @_persists
+    def patch_schedule(self, **fields) -> bool:
+        """Update only the given schedule fields, leaving concurrent changes to the others intact"""
+        return self._patch_schedule(**fields)
+    
+    @_persists
     def move_to_next_participant(self) -> bool:
         """Move pointer to next participant in rotation"""
-        schedule = self.get_schedule()
-        
-        if not schedule.rotation_list:
-            return False
-        
-        schedule.next_pointer_index = (schedule.next_pointer_index + 1) % len(schedule.rotation_list)
-        return self.update_schedule(schedule)
+        with self.lock:
+            schedule = self._read_db()["schedule"]
+            
+            if not schedule["rotation_list"]:
+                return False
+            
+            return self._patch_schedule(
+                next_pointer_index=(schedule["next_pointer_index"] + 1) % len(schedule["rotation_list"])
+            )
     
+    @_persists
     def add_skipped_participant(self, telegram_id: int) -> bool:
         """Add participant to skipped list for current round"""
-        schedule = self.get_schedule()
-        
-        if telegram_id not in schedule.skipped_this_round:
-            schedule.skipped_this_round.append(telegram_id)
-            return self.update_schedule(schedule)
-        
-        return False
+        with self.lock:
+            skipped = self._read_db()["schedule"]["skipped_this_round"]
+            
+            if telegram_id not in self._skipped_set:
+                skipped.append(telegram_id)
+                self._skipped_set.add(telegram_id)
+                self._write_db(self._cache)
+                return True
+            
+            return False
+    
+    @_persists
+    def record_decline(self, telegram_id: int) -> Schedule:
+        """Mark a participant as skipped and the assignment as searching in one write"""
+        with self.lock:
+            schedule = self._read_db()["schedule"]
+            
+            if telegram_id not in self._skipped_set:
+                schedule["skipped_this_round"].append(telegram_id)
+                self._skipped_set.add(telegram_id)
+            schedule["assignment_status"] = "searching"
+            
+            self._write_db(self._cache)
+            return Schedule.from_dict(copy.deepcopy(schedule))
+    
+    def is_skipped(self, telegram_id: int) -> bool:
+        """Check whether a participant has been skipped this round"""
+        self._read_db()
+        return telegram_id in self._skipped_set
+    
+    def skipped_count(self) -> int:
+        """Get the number of participants skipped this round"""
+        self._read_db()
+        return len(self._skipped_set)
     
+    @_persists
     def clear_skipped_participants(self) -> bool:
         """Clear the skipped participants list (after successful confirmation)"""
-        schedule = self.get_schedule()
-        schedule.skipped_this_round = []
-        return self.update_schedule(schedule)
+        return self._patch_schedule(skipped_this_round=[])
     
+    @_persists
     def set_current_assignment(self, telegram_id: int, meeting_date: str) -> bool:
         """Set the current assignment"""
-        schedule = self.get_schedule()
-        schedule.current_assigned_id = telegram_id
-        schedule.next_meeting_date = meeting_date
-        schedule.last_assignment_date = datetime.now().isoformat()
-        schedule.assignment_status = "pending"
-        return self.update_schedule(schedule)
-    
-    def confirm_assignment(self) -> bool:
-        """Confirm the current assignment"""
-        schedule = self.get_schedule()
-        schedule.assignment_status = "confirmed"
-        schedule.skipped_this_round = []  # Clear skipped list
-        self.move_to_next_participant()  # Move pointer for next week
-        return self.update_schedule(schedule)
\ No newline at end of file
+        return self._patch_schedule(
+            current_assigned_id=telegram_id,
+            next_meeting_date=meeting_date,
+            last_assignment_date=datetime.now().isoformat(),
+            assignment_status="pending"
+        )
+    
+    @_persists
+    def confirm_assignment(self, telegram_id: Optional[int] = None) -> bool:
+        """Confirm the current assignment; False if it isn't pending (or isn't telegram_id's), so repeats change nothing"""
+        with self.lock:
+            schedule = self._read_db()["schedule"]
+            if schedule["assignment_status"] != "pending":
+                return False
+            if telegram_id is not None and schedule["current_assigned_id"] != telegram_id:
+                return False
+            
+            with self._batched():
+                self._patch_schedule(
+                    assignment_status="confirmed",
+                    skipped_this_round=[]  # Clear skipped list
+                )
+                self.move_to_next_participant()  # Move pointer for next week
+            return True
+
+@lru_cache(maxsize=None)
+def get_db_manager(db_path: str = "data/db.json") -> DatabaseManager:
+    """Get the process-wide DatabaseManager for a database file"""
+    return DatabaseManager(db_path)
\ No newline at end of file
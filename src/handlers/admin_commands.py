@@ -1,8 +1,10 @@
 import logging
-from datetime import datetime, timedelta
+import asyncio
+from datetime import date
 from telegram import Update
 from telegram.ext import ContextTypes
 from src.auth.auth_manager import admin_required
+from src.models.database_schema import UserStatus
 from src.utils.message_templates import MessageTemplates
 from src.utils.datetime_utils import parse_date, format_date, get_next_wednesday
 
@@ -19,10 +21,15 @@ class AdminCommandHandler:
         # Get schedule
         schedule = db_manager.get_schedule()
         
+        # Fetch everyone the status page mentions in one go
+        participants = db_manager.get_participants_by_ids(
+            {schedule.current_assigned_id, *schedule.rotation_list, *schedule.skipped_this_round}
+        )
+        
         # Get current assigned participant
         current_assigned = None
         if schedule.current_assigned_id:
-            participant = db_manager.get_participant(schedule.current_assigned_id)
+            participant = participants.get(schedule.current_assigned_id)
             if participant:
                 current_assigned = f"{participant.full_name} ({participant.telegram_id})"
         
@@ -34,32 +41,33 @@ class AdminCommandHandler:
                 next_person = f"{next_participant.full_name} ({next_participant.telegram_id})"
         
         # Format and send status
-        status_text = MessageTemplates.format_rotation_status(
+        parts = [MessageTemplates.format_rotation_status(
             current_assigned, 
             next_person, 
             schedule.next_meeting_date
-        )
+        )]
         
         # Add rotation list
-        status_text += "\n\n**📋 Full Rotation Order:**\n"
+        parts.append(MessageTemplates.ROTATION_HEADER)
         if schedule.rotation_list:
-            for i, user_id in enumerate(schedule.rotation_list):
-                participant = db_manager.get_participant(user_id)
-                if participant:
-                    pointer = "👉 " if i == schedule.next_pointer_index else "   "
-                    status_text += f"{pointer}{i+1}. {participant.full_name}\n"
+            pointer_index = schedule.next_pointer_index
+            parts.extend(
+                f"{'👉 ' if i == pointer_index else '   '}{i+1}. {participants[user_id].full_name}\n"
+                for i, user_id in enumerate(schedule.rotation_list)
+                if user_id in participants
+            )
         else:
-            status_text += "No participants in rotation.\n"
+            parts.append("No participants in rotation.\n")
         
         # Add skipped this round
         if schedule.skipped_this_round:
-            status_text += "\n**⏭️ Skipped This Round:**\n"
+            parts.append(MessageTemplates.SKIPPED_HEADER)
             for user_id in schedule.skipped_this_round:
-                participant = db_manager.get_participant(user_id)
+                participant = participants.get(user_id)
                 if participant:
-                    status_text += f"• {participant.full_name}\n"
+                    parts.append(f"• {participant.full_name}\n")
         
-        await update.message.reply_text(status_text, parse_mode='Markdown')
+        await update.message.reply_text("".join(parts), parse_mode='Markdown')
     
     @admin_required
     async def adjust_date(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -78,26 +86,26 @@ class AdminCommandHandler:
         
         # Validate date format
         try:
-            meeting_date = datetime.strptime(date_str, "%Y-%m-%d")
+            meeting_date = date.fromisoformat(date_str)
             
             # Check if date is in the future
-            if meeting_date.date() <= datetime.now().date():
+            if meeting_date <= date.today():
                 await update.message.reply_text(
                     "❌ Meeting date must be in the future."
                 )
                 return
             
-            # Update schedule
-            schedule = db_manager.get_schedule()
-            schedule.next_meeting_date = date_str
+            # fromisoformat also accepts forms like 20261231, so store the canonical YYYY-MM-DD
+            date_str = meeting_date.isoformat()
             
-            if db_manager.update_schedule(schedule):
+            # Update only the meeting date so a concurrent decline or confirmation isn't overwritten
+            if await asyncio.to_thread(db_manager.patch_schedule, next_meeting_date=date_str):
                 await update.message.reply_text(
                     f"✅ Meeting date adjusted to: **{date_str}**\n\n"
                     f"Day: {meeting_date.strftime('%A')}",
                     parse_mode='Markdown'
                 )
-                logger.info(f"Admin {update.effective_user.id} adjusted meeting date to {date_str}")
+                logger.info("Admin %s adjusted meeting date to %s", update.effective_user.id, date_str)
             else:
                 await update.message.reply_text("❌ Failed to update meeting date.")
                 
@@ -134,7 +142,7 @@ class AdminCommandHandler:
             await update.message.reply_text(f"❌ No participant found with ID: {participant_id}")
             return
         
-        if participant.status != "approved":
+        if participant.status is not UserStatus.APPROVED:
             await update.message.reply_text(
                 f"❌ Participant {participant.full_name} is not approved.\n"
                 f"Current status: {participant.status}"
@@ -145,14 +153,15 @@ class AdminCommandHandler:
         schedule = db_manager.get_schedule()
         if not schedule.next_meeting_date:
             next_wednesday = get_next_wednesday()
-            schedule.next_meeting_date = next_wednesday.strftime("%Y-%m-%d")
-        
-        # Manually assign
-        if db_manager.set_current_assignment(participant_id, schedule.next_meeting_date):
-            # Update schedule to mark as manually assigned
-            schedule = db_manager.get_schedule()
-            schedule.assignment_status = "pending"
-            db_manager.update_schedule(schedule)
+            schedule.next_meeting_date = next_wednesday.date().isoformat()
+        
+        # Manually assign (this also marks the assignment as pending)
+        if await asyncio.to_thread(db_manager.set_current_assignment, participant_id, schedule.next_meeting_date):
+            
+            # Let the scheduler track the new response deadline
+            scheduler = context.bot_data.get('scheduler')
+            if scheduler:
+                scheduler.refresh_pending_deadline()
             
             await update.message.reply_text(
                 f"✅ Manually assigned Happy Hour Duty to:\n"
@@ -163,7 +172,7 @@ class AdminCommandHandler:
             )
             
             # TODO: Trigger notification to assigned person
-            logger.info(f"Admin {update.effective_user.id} manually assigned duty to {participant_id}")
+            logger.info("Admin %s manually assigned duty to %s", update.effective_user.id, participant_id)
         else:
             await update.message.reply_text("❌ Failed to assign duty.")
     
@@ -187,65 +196,56 @@ class AdminCommandHandler:
             await update.message.reply_text("❌ Invalid participant ID. Must be a number.")
             return
         
-        # Get participant info before removal
-        participant = db_manager.get_participant(participant_id)
+        # Remove participant, getting back the removed record for the reply
+        participant = await asyncio.to_thread(db_manager.pop_participant, participant_id)
         
         if not participant:
             await update.message.reply_text(f"❌ No participant found with ID: {participant_id}")
             return
         
-        # Remove participant
-        if db_manager.remove_participant(participant_id):
-            await update.message.reply_text(
-                f"✅ Successfully removed participant:\n"
-                f"**{participant.full_name}** (ID: {participant_id})\n\n"
-                f"They have been removed from the rotation list.",
-                parse_mode='Markdown'
-            )
-            logger.info(f"Admin {update.effective_user.id} removed participant {participant_id}")
-        else:
-            await update.message.reply_text("❌ Failed to remove participant.")
+        await update.message.reply_text(
+            f"✅ Successfully removed participant:\n"
+            f"**{participant.full_name}** (ID: {participant_id})\n\n"
+            f"They have been removed from the rotation list.",
+            parse_mode='Markdown'
+        )
+        logger.info("Admin %s removed participant %s", update.effective_user.id, participant_id)
     
     @admin_required
     async def list_users(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List all participants with their status"""
         db_manager = context.bot_data.get('db_manager')
         
-        # Get all participants
-        all_participants = db_manager.get_all_participants()
+        # Read each status straight from the database's status index
+        approved = db_manager.get_all_participants(status=UserStatus.APPROVED)
+        pending = db_manager.get_all_participants(status=UserStatus.PENDING)
+        inactive = db_manager.get_all_participants(status=UserStatus.INACTIVE)
+        total = len(approved) + len(pending) + len(inactive)
         
-        if not all_participants:
+        if not total:
             await update.message.reply_text("No participants registered yet.")
             return
         
-        # Group by status
-        approved = [p for p in all_participants if p.status == "approved"]
-        pending = [p for p in all_participants if p.status == "pending"]
-        inactive = [p for p in all_participants if p.status == "inactive"]
-        
-        text = "**👥 All Participants**\n\n"
+        parts = ["**👥 All Participants**\n\n"]
         
         if approved:
-            text += "**✅ Approved:**\n"
-            for p in approved:
-                text += f"• {p.full_name} (ID: {p.telegram_id})\n"
-            text += "\n"
+            parts.append("**✅ Approved:**\n")
+            parts.extend(f"• {p.full_name} (ID: {p.telegram_id})\n" for p in approved)
+            parts.append("\n")
         
         if pending:
-            text += "**⏳ Pending Approval:**\n"
-            for p in pending:
-                text += f"• {p.full_name} (ID: {p.telegram_id})\n"
-            text += "\n"
+            parts.append("**⏳ Pending Approval:**\n")
+            parts.extend(f"• {p.full_name} (ID: {p.telegram_id})\n" for p in pending)
+            parts.append("\n")
         
         if inactive:
-            text += "**❌ Inactive:**\n"
-            for p in inactive:
-                text += f"• {p.full_name} (ID: {p.telegram_id})\n"
-            text += "\n"
+            parts.append("**❌ Inactive:**\n")
+            parts.extend(f"• {p.full_name} (ID: {p.telegram_id})\n" for p in inactive)
+            parts.append("\n")
         
-        text += f"**Total:** {len(all_participants)} participants"
+        parts.append(f"**Total:** {total} participants")
         
-        await update.message.reply_text(text, parse_mode='Markdown')
+        await update.message.reply_text("".join(parts), parse_mode='Markdown')
     
     @admin_required
     async def trigger_weekly(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -263,7 +263,7 @@ class AdminCommandHandler:
             await scheduler.weekly_notification_job()
             await update.message.reply_text("✅ Weekly notification job completed")
         except Exception as e:
-            logger.error(f"Error triggering weekly job: {e}", exc_info=True)
+            logger.error("Error triggering weekly job: %s", e, exc_info=True)
             await update.message.reply_text(f"❌ Error: {str(e)}")
     
     @admin_required
@@ -271,14 +271,13 @@ class AdminCommandHandler:
         """Reset the current round (clear skipped list)"""
         db_manager = context.bot_data.get('db_manager')
         
-        # Clear skipped participants
-        db_manager.clear_skipped_participants()
-        
-        # Reset assignment status
-        schedule = db_manager.get_schedule()
-        schedule.assignment_status = "pending"
-        schedule.current_assigned_id = None
-        db_manager.update_schedule(schedule)
+        # Clear skipped participants and reset assignment status in one write, leaving the other fields alone
+        await asyncio.to_thread(
+            db_manager.patch_schedule,
+            skipped_this_round=[],
+            assignment_status="pending",
+            current_assigned_id=None
+        )
         
         await update.message.reply_text(
             "✅ Round reset successfully!\n\n"
@@ -1,4 +1,5 @@
 import logging
+import asyncio
 from telegram import Update
 from telegram.ext import ContextTypes
 from src.models.database_schema import UserStatus
@@ -21,14 +22,18 @@ class ApprovalHandler:
             await query.answer("User not found in database.")
             return
         
-        if participant.status != UserStatus.PENDING.value:
+        if participant.status is not UserStatus.PENDING:
             await query.answer(f"User already processed (status: {participant.status})")
             return
         
+        # Acknowledge right away so the button stops spinning while the write runs; the write itself only
+        # goes through while the user is still pending, in case another admin handled them meanwhile
+        context.application.create_task(query.answer(), update=update)
+        
         if approved:
             # Approve user
-            participant.status = UserStatus.APPROVED.value
-            if db_manager.update_participant(participant):
+            participant.status = UserStatus.APPROVED
+            if await asyncio.to_thread(db_manager.update_participant, participant, UserStatus.PENDING):
                 # Update the admin's message
                 await query.edit_message_text(
                     f"✅ **Approved**\n\n"
@@ -39,28 +44,29 @@ class ApprovalHandler:
                     parse_mode='Markdown'
                 )
                 
-                # Notify the user
-                try:
-                    await context.bot.send_message(
-                        chat_id=user_id,
-                        text=(
+                # Notify the user in the background so the admin's callback isn't held up
+                context.application.create_task(
+                    self._notify_user(
+                        context.bot,
+                        user_id,
+                        (
                             "🎉 **Great news!**\n\n"
                             "Your registration has been approved!\n"
                             "You've been added to the Happy Hour Duty list.\n\n"
                             "You'll receive a notification when it's your turn to bring refreshments."
                         ),
                         parse_mode='Markdown'
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to notify approved user {user_id}: {e}")
+                    ),
+                    update=update
+                )
                 
-                logger.info(f"User {participant.full_name} approved by admin {admin_user.id}")
+                logger.info("User %s approved by admin %s", participant.full_name, admin_user.id)
             else:
-                await query.answer("Failed to update user status.")
+                await query.message.reply_text("User was already processed by another admin.")
         else:
             # Reject user
-            participant.status = UserStatus.INACTIVE.value
-            if db_manager.update_participant(participant):
+            participant.status = UserStatus.INACTIVE
+            if await asyncio.to_thread(db_manager.update_participant, participant, UserStatus.PENDING):
                 # Update the admin's message
                 await query.edit_message_text(
                     f"❌ **Rejected**\n\n"
@@ -71,20 +77,26 @@ class ApprovalHandler:
                     parse_mode='Markdown'
                 )
                 
-                # Notify the user
-                try:
-                    await context.bot.send_message(
-                        chat_id=user_id,
-                        text=(
+                # Notify the user in the background so the admin's callback isn't held up
+                context.application.create_task(
+                    self._notify_user(
+                        context.bot,
+                        user_id,
+                        (
                             "Unfortunately, your registration has been rejected.\n\n"
                             "If you believe this is an error, please contact an administrator."
                         )
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to notify rejected user {user_id}: {e}")
+                    ),
+                    update=update
+                )
                 
-                logger.info(f"User {participant.full_name} rejected by admin {admin_user.id}")
+                logger.info("User %s rejected by admin %s", participant.full_name, admin_user.id)
             else:
-                await query.answer("Failed to update user status.")
-        
-        await query.answer()
\ No newline at end of file
+                await query.message.reply_text("User was already processed by another admin.")
+    
+    async def _notify_user(self, bot, user_id: int, text: str, parse_mode: str = None):
+        """Send the approval outcome to the user, logging instead of raising on failure"""
+        try:
+            await bot.send_message(chat_id=user_id, text=text, parse_mode=parse_mode)
+        except Exception as e:
+            logger.error("Failed to notify user %s of approval decision: %s", user_id, e)
\ No newline at end of file
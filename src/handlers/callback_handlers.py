@@ -1,4 +1,7 @@
 import logging
+import asyncio
+from typing import Set, Tuple
+from weakref import WeakValueDictionary
 from telegram import Update
 from telegram.ext import ContextTypes
 from src.handlers.approval_handler import ApprovalHandler
@@ -13,31 +16,52 @@ class CallbackHandler:
     def __init__(self):
         self.approval_handler = ApprovalHandler()
         self.response_handler = ResponseHandler()
+        # One lock per user keeps each user's callbacks in order; idle locks drop out on their own
+        self._user_locks: "WeakValueDictionary[int, asyncio.Lock]" = WeakValueDictionary()
+        # (user ID, callback data) pairs currently being handled, used to drop repeated presses
+        self._in_flight: Set[Tuple[int, str]] = set()
     
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Route callback queries to appropriate handlers"""
         query = update.callback_query
         data = query.data
         
-        logger.debug(f"Received callback: {data} from user {update.effective_user.id}")
+        logger.debug("Received callback: %s from user %s", data, update.effective_user.id)
         
-        # Parse callback data
-        if data.startswith("approve_"):
-            # Admin approval
-            await self._handle_admin_action(update, context, data, True)
-        elif data.startswith("reject_"):
-            # Admin rejection
-            await self._handle_admin_action(update, context, data, False)
-        elif data == "confirm_duty":
-            # Participant confirms duty
-            await self.response_handler.handle_confirmation(update, context)
-        elif data == "decline_duty":
-            # Participant declines duty
-            await self.response_handler.handle_decline(update, context)
-        else:
-            await query.answer("Unknown action")
+        # The same button pressed again while its first press is still being handled is a duplicate
+        key = (update.effective_user.id, data)
+        if key in self._in_flight:
+            await query.answer("Already processing…")
+            return
+        
+        self._in_flight.add(key)
+        try:
+            lock = self._user_locks.get(update.effective_user.id)
+            if lock is None:
+                lock = asyncio.Lock()
+                self._user_locks[update.effective_user.id] = lock
+            
+            async with lock:
+                # Parse callback data
+                prefix, _, payload = data.partition("_")
+                if prefix == "approve":
+                    # Admin approval
+                    await self._handle_admin_action(update, context, payload, True)
+                elif prefix == "reject":
+                    # Admin rejection
+                    await self._handle_admin_action(update, context, payload, False)
+                elif data == "confirm_duty":
+                    # Participant confirms duty
+                    await self.response_handler.handle_confirmation(update, context)
+                elif data == "decline_duty":
+                    # Participant declines duty
+                    await self.response_handler.handle_decline(update, context)
+                else:
+                    await query.answer("Unknown action")
+        finally:
+            self._in_flight.discard(key)
     
-    async def _handle_admin_action(self, update: Update, context: ContextTypes.DEFAULT_TYPE, data: str, approved: bool):
+    async def _handle_admin_action(self, update: Update, context: ContextTypes.DEFAULT_TYPE, payload: str, approved: bool):
         """Handle admin approval/rejection actions"""
         # Check if user is admin
         config_manager = context.bot_data.get('config_manager')
@@ -47,12 +71,9 @@ class CallbackHandler:
         
         # Extract user ID from callback data
         try:
-            if approved:
-                user_id = int(data.replace("approve_", ""))
-            else:
-                user_id = int(data.replace("reject_", ""))
+            user_id = int(payload)
             
             await self.approval_handler.handle_approval(update, context, user_id, approved)
         except ValueError:
-            logger.error(f"Invalid callback data: {data}")
+            logger.error("Invalid callback data: %s", update.callback_query.data)
             await update.callback_query.answer("Invalid data format")
\ No newline at end of file
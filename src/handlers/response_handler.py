@@ -1,9 +1,8 @@
 import logging
+import asyncio
 from telegram import Update
 from telegram.ext import ContextTypes
 from src.utils.message_templates import MessageTemplates
-from src.notifications.notifier import NotificationManager
-from src.schedule.rotation_manager import RotationManager
 from src.utils.datetime_utils import get_next_wednesday
 
 logger = logging.getLogger(__name__)
@@ -25,8 +24,15 @@ class ResponseHandler:
             await query.answer("This assignment is not for you.")
             return
         
-        # Confirm assignment
-        if db_manager.confirm_assignment():
+        if schedule.assignment_status != "pending":
+            await query.answer("This assignment is already confirmed.")
+            return
+        
+        # Acknowledge right away so the button stops spinning while the write runs
+        context.application.create_task(query.answer("Thank you for confirming!"), update=update)
+        
+        # Confirm assignment; only one of several concurrent presses gets through
+        if await asyncio.to_thread(db_manager.confirm_assignment, user_id):
             participant = db_manager.get_participant(user_id)
             
             # Cancel timeout if scheduler exists
@@ -43,14 +49,16 @@ class ResponseHandler:
                 parse_mode='Markdown'
             )
             
-            # Notify admins of confirmation
-            notifier = NotificationManager(context.application, db_manager)
-            await notifier.notify_admins_of_confirmation(participant, schedule.next_meeting_date)
+            # Notify admins of confirmation in the background so the participant gets answered right away
+            notifier = context.bot_data['notifier']
+            context.application.create_task(
+                notifier.notify_admins_of_confirmation(participant, schedule.next_meeting_date),
+                update=update
+            )
             
-            logger.info(f"User {user_id} confirmed duty for {schedule.next_meeting_date}")
-            await query.answer("Thank you for confirming!")
+            logger.info("User %s confirmed duty for %s", user_id, schedule.next_meeting_date)
         else:
-            await query.answer("Failed to confirm assignment. Please contact an admin.")
+            await query.message.reply_text("This assignment was already confirmed.")
     
     async def handle_decline(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle duty decline from participant"""
@@ -66,6 +74,9 @@ class ResponseHandler:
             await query.answer("This assignment is not for you.")
             return
         
+        # Acknowledge right away so the button stops spinning while the rest runs
+        context.application.create_task(query.answer("Understood. Finding replacement..."), update=update)
+        
         # Cancel timeout if scheduler exists
         if 'scheduler' in context.bot_data:
             scheduler = context.bot_data['scheduler']
@@ -79,35 +90,30 @@ class ResponseHandler:
             parse_mode='Markdown'
         )
         
-        logger.info(f"User {user_id} declined duty for {schedule.next_meeting_date}")
-        await query.answer("Understood. Finding replacement...")
+        logger.info("User %s declined duty for %s", user_id, schedule.next_meeting_date)
         
         # Trigger fallback logic through scheduler
         if 'scheduler' in context.bot_data:
             scheduler = context.bot_data['scheduler']
-            # Add to skipped list and find next person
-            db_manager.add_skipped_participant(user_id)
-            
-            # Update status
-            schedule.assignment_status = "searching"
-            db_manager.update_schedule(schedule)
+            # Add to skipped list and mark the assignment as searching in one write
+            await asyncio.to_thread(db_manager.record_decline, user_id)
             
             # Trigger async fallback
             await scheduler.handle_decline(user_id)
         else:
             # Fallback without scheduler (manual mode)
-            rotation_manager = RotationManager(db_manager)
-            next_participant = rotation_manager.skip_current_and_get_next()
+            rotation_manager = context.bot_data['rotation_manager']
+            next_participant, _ = await asyncio.to_thread(rotation_manager.skip_current_and_get_next)
             
             if next_participant:
                 # Assign to next person
-                meeting_date = schedule.next_meeting_date or get_next_wednesday().strftime("%Y-%m-%d")
-                rotation_manager.assign_duty(next_participant.telegram_id, meeting_date)
+                meeting_date = schedule.next_meeting_date or get_next_wednesday().date().isoformat()
+                await asyncio.to_thread(rotation_manager.assign_duty, next_participant.telegram_id, meeting_date)
                 
                 # Send notification
-                notifier = NotificationManager(context.application, db_manager)
+                notifier = context.bot_data['notifier']
                 await notifier.send_duty_notification(next_participant, meeting_date)
             else:
                 # Escalate
-                notifier = NotificationManager(context.application, db_manager)
+                notifier = context.bot_data['notifier']
                 await notifier.send_escalation_alert(schedule.next_meeting_date)
\ No newline at end of file
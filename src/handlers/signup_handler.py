@@ -1,4 +1,5 @@
 import logging
+import asyncio
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from src.models.database_schema import Participant, UserStatus
@@ -6,6 +7,15 @@ from src.utils.message_templates import MessageTemplates
 
 logger = logging.getLogger(__name__)
 
+def _approval_keyboard(telegram_id: int) -> InlineKeyboardMarkup:
+    """Build the approve/reject buttons for a pending user"""
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("✅ Approve", callback_data=f"approve_{telegram_id}"),
+            InlineKeyboardButton("❌ Reject", callback_data=f"reject_{telegram_id}")
+        ]
+    ])
+
 class SignupHandler:
     """Handles user signup process"""
     
@@ -18,13 +28,13 @@ class SignupHandler:
         participant = db_manager.get_participant(user.id)
         
         if participant:
-            if participant.status == UserStatus.APPROVED.value:
+            if participant.status is UserStatus.APPROVED:
                 await update.message.reply_text(
                     f"👋 Hello {participant.full_name}!\n\n"
                     "You're already registered and approved for the happy hour duty.\n"
                     "You'll receive notifications when it's your turn."
                 )
-            elif participant.status == UserStatus.PENDING.value:
+            elif participant.status is UserStatus.PENDING:
                 await update.message.reply_text(
                     f"Hello {participant.full_name}!\n\n"
                     "Your registration is pending admin approval.\n"
@@ -77,10 +87,10 @@ class SignupHandler:
         participant = Participant(
             telegram_id=user.id,
             full_name=full_name,
-            status=UserStatus.PENDING.value
+            status=UserStatus.PENDING
         )
         
-        if db_manager.add_participant(participant):
+        if await asyncio.to_thread(db_manager.add_participant, participant):
             # Clear state
             context.user_data['awaiting_name'] = False
             
@@ -94,7 +104,7 @@ class SignupHandler:
             # Notify admins
             await self._notify_admins_of_new_user(context, participant)
             
-            logger.info(f"New user registered: {full_name} (ID: {user.id})")
+            logger.info("New user registered: %s (ID: %s)", full_name, user.id)
         else:
             await update.message.reply_text(
                 "An error occurred during registration. Please try again or contact an admin."
@@ -105,31 +115,16 @@ class SignupHandler:
         config = context.bot_data.get('config')
         
         # Create inline keyboard for approval
-        keyboard = [
-            [
-                InlineKeyboardButton("✅ Approve", callback_data=f"approve_{participant.telegram_id}"),
-                InlineKeyboardButton("❌ Reject", callback_data=f"reject_{participant.telegram_id}")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = _approval_keyboard(participant.telegram_id)
         
-        message_text = (
-            "🔔 **New User Registration**\n\n"
-            f"**Name:** {participant.full_name}\n"
-            f"**Telegram ID:** {participant.telegram_id}\n"
-            f"**Status:** Pending Approval\n\n"
-            "Please review and approve or reject this registration."
-        )
+        message_text = MessageTemplates.admin_approval_request(participant.full_name, participant.telegram_id)
         
-        # Send to all admins
-        for admin_id in config.admin_ids:
-            try:
-                await context.bot.send_message(
-                    chat_id=admin_id,
-                    text=message_text,
-                    reply_markup=reply_markup,
-                    parse_mode='Markdown'
-                )
-                logger.info(f"Sent approval request to admin {admin_id}")
-            except Exception as e:
-                logger.error(f"Failed to notify admin {admin_id}: {e}")
\ No newline at end of file
+        # Send to all admins at once, sharing the same text and keyboard
+        notifier = context.bot_data['notifier']
+        results = await notifier.send_to_admins(config.admin_ids, message_text, reply_markup)
+        
+        for admin_id, error in results.items():
+            if error:
+                logger.error("Failed to notify admin %s: %s", admin_id, error)
+            else:
+                logger.info("Sent approval request to admin %s", admin_id)
\ No newline at end of file
@@ -15,6 +15,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.bot.bot_core import HappyHourDutyBot
 from src.utils.logger import setup_logging
 
+try:
+    import uvloop
+except ImportError:  # Optional; not available on Windows
+    uvloop = None
+
 def main():
     """Main entry point"""
     # Set up logging
@@ -27,32 +32,21 @@ def main():
     logger.info("="*50)
     
     try:
+        # Use uvloop's faster event loop when it is installed, otherwise the asyncio default
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Using uvloop event loop")
+        
         # Create bot
         bot = HappyHourDutyBot()
         
-        async def start_bot():
-            await bot.setup()
-            await bot.application.start()
-            await bot.application.updater.start_polling()
-            
-            try:
-                # Keep the bot running until interrupted
-                while True:
-                    await asyncio.sleep(1)
-            except asyncio.CancelledError:
-                pass
-            
-            # Cleanup
-            await bot.application.stop()
-            await bot.application.shutdown()
-        
-        # Run the bot
-        asyncio.run(start_bot())
+        # Run the bot; it waits on a stop event set by SIGINT/SIGTERM and always cleans up
+        asyncio.run(bot.run())
         
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
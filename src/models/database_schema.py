@@ -1,29 +1,41 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 
-class UserStatus(Enum):
+class UserStatus(str, Enum):
     PENDING = "pending"
     APPROVED = "approved"
     INACTIVE = "inactive"
+    
+    def __str__(self) -> str:
+        return self.value
 
-@dataclass
+@dataclass(slots=True)
 class Participant:
     """Participant data model"""
     telegram_id: int
     full_name: str
-    status: str = UserStatus.PENDING.value
+    status: UserStatus = UserStatus.PENDING
     joined_date: str = field(default_factory=lambda: datetime.now().isoformat())
     
+    def __post_init__(self):
+        # Statuses come in as plain strings from JSON; members can then be compared with `is`
+        self.status = UserStatus(self.status)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "telegram_id": self.telegram_id,
+            "full_name": self.full_name,
+            "status": self.status.value,
+            "joined_date": self.joined_date
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Participant':
         return cls(**data)
 
-@dataclass
+@dataclass(slots=True)
 class Schedule:
     """Schedule data model"""
     rotation_list: List[int] = field(default_factory=list)
@@ -35,7 +47,16 @@ class Schedule:
     assignment_status: str = "pending"  # pending, confirmed, searching
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Lists are copied so the stored dict never shares them with this object
+        return {
+            "rotation_list": list(self.rotation_list),
+            "next_pointer_index": self.next_pointer_index,
+            "last_assignment_date": self.last_assignment_date,
+            "next_meeting_date": self.next_meeting_date,
+            "skipped_this_round": list(self.skipped_this_round),
+            "current_assigned_id": self.current_assigned_id,
+            "assignment_status": self.assignment_status
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Schedule':
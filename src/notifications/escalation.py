@@ -1,8 +1,9 @@
 import logging
-from typing import List
+from typing import List, Optional
 from telegram.ext import Application
 from src.config import BotConfig
 from src.database.db_manager import DatabaseManager
+from src.models.database_schema import Schedule
 from src.notifications.notifier import NotificationManager
 
 logger = logging.getLogger(__name__)
@@ -26,19 +27,20 @@ class EscalationHandler:
         # Check if all participants have been exhausted
         if not schedule.rotation_list:
             logger.warning("No participants in rotation list")
-            await self.escalate("No participants in rotation list")
+            await self.escalate("No participants in rotation list", schedule)
             return True
         
-        if len(schedule.skipped_this_round) >= len(schedule.rotation_list):
+        if self.db_manager.skipped_count() >= len(schedule.rotation_list):
             logger.warning("All participants have declined or timed out")
-            await self.escalate("All participants have declined or timed out")
+            await self.escalate("All participants have declined or timed out", schedule)
             return True
         
         return False
     
-    async def escalate(self, reason: str):
+    async def escalate(self, reason: str, schedule: Optional[Schedule] = None):
         """Escalate to admins with specific reason"""
-        schedule = self.db_manager.get_schedule()
+        if schedule is None:
+            schedule = self.db_manager.get_schedule()
         meeting_date = schedule.next_meeting_date or "TBD"
         
         # Send detailed escalation message
@@ -53,12 +55,10 @@ class EscalationHandler:
         if schedule.skipped_this_round:
             message += f"• {len(schedule.skipped_this_round)} participants declined/timed out\n"
             
-            # List who declined
-            declined_names = []
-            for user_id in schedule.skipped_this_round[:5]:  # Show first 5
-                participant = self.db_manager.get_participant(user_id)
-                if participant:
-                    declined_names.append(participant.full_name)
+            # List who declined (first 5), looked up together
+            shown_ids = schedule.skipped_this_round[:5]
+            participants = self.db_manager.get_participants_by_ids(shown_ids)
+            declined_names = [participants[user_id].full_name for user_id in shown_ids if user_id in participants]
             
             if declined_names:
                 message += f"• Declined by: {', '.join(declined_names)}"
@@ -68,14 +68,11 @@ class EscalationHandler:
         
         message += "\n**Action Required:** Please manually assign someone or adjust the schedule."
         
-        # Send to all admins
-        for admin_id in self.config.admin_ids:
-            try:
-                await self.application.bot.send_message(
-                    chat_id=admin_id,
-                    text=message,
-                    parse_mode='Markdown'
-                )
-                logger.info(f"Escalation sent to admin {admin_id}")
-            except Exception as e:
-                logger.error(f"Failed to send escalation to admin {admin_id}: {e}")
\ No newline at end of file
+        # Send to all admins at once
+        results = await self.notifier.send_to_admins(self.config.admin_ids, message)
+        
+        for admin_id, error in results.items():
+            if error:
+                logger.error("Failed to send escalation to admin %s: %s", admin_id, error)
+            else:
+                logger.info("Escalation sent to admin %s", admin_id)
\ No newline at end of file
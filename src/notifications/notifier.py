@@ -1,5 +1,7 @@
 import logging
-from typing import List, Optional
+import asyncio
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import Application
 from telegram.error import TelegramError
@@ -10,6 +12,21 @@ from src.utils.datetime_utils import format_date, parse_date
 
 logger = logging.getLogger(__name__)
 
+# Confirm/decline buttons shared by every duty notification and reminder (markup objects are immutable)
+_DUTY_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("✅ Confirm", callback_data="confirm_duty"),
+        InlineKeyboardButton("❌ Cannot", callback_data="decline_duty")
+    ]
+])
+
+@lru_cache(maxsize=64)
+def _display_date(meeting_date: str) -> str:
+    """Format a YYYY-MM-DD meeting date for display, falling back to the raw string"""
+    # Every notification in a duty cycle shows the same date, so it is parsed once
+    date_obj = parse_date(meeting_date)
+    return format_date(date_obj) if date_obj else meeting_date
+
 class NotificationManager:
     """Manages all bot notifications"""
     
@@ -21,18 +38,7 @@ class NotificationManager:
     async def send_duty_notification(self, participant: Participant, meeting_date: str) -> bool:
         """Send duty assignment notification to participant"""
         try:
-            # Parse and format date
-            date_obj = parse_date(meeting_date)
-            formatted_date = format_date(date_obj) if date_obj else meeting_date
-            
-            # Create inline keyboard
-            keyboard = [
-                [
-                    InlineKeyboardButton("✅ Confirm", callback_data="confirm_duty"),
-                    InlineKeyboardButton("❌ Cannot", callback_data="decline_duty")
-                ]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            formatted_date = _display_date(meeting_date)
             
             # Send notification
             message = MessageTemplates.duty_notification(participant.full_name, formatted_date)
@@ -40,26 +46,24 @@ class NotificationManager:
             await self.bot.send_message(
                 chat_id=participant.telegram_id,
                 text=message,
-                reply_markup=reply_markup,
+                reply_markup=_DUTY_KEYBOARD,
                 parse_mode='Markdown'
             )
             
-            logger.info(f"Duty notification sent to {participant.full_name} for {meeting_date}")
+            logger.info("Duty notification sent to %s for %s", participant.full_name, meeting_date)
             return True
             
         except TelegramError as e:
-            logger.error(f"Failed to send notification to {participant.full_name}: {e}")
+            logger.error("Failed to send notification to %s: %s", participant.full_name, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error sending notification: {e}", exc_info=True)
+            logger.error("Unexpected error sending notification: %s", e, exc_info=True)
             return False
     
     async def send_confirmation_acknowledgment(self, participant: Participant, meeting_date: str) -> bool:
         """Send confirmation acknowledgment to participant"""
         try:
-            # Parse and format date
-            date_obj = parse_date(meeting_date)
-            formatted_date = format_date(date_obj) if date_obj else meeting_date
+            formatted_date = _display_date(meeting_date)
             
             message = MessageTemplates.duty_confirmed(participant.full_name, formatted_date)
             
@@ -72,7 +76,7 @@ class NotificationManager:
             return True
             
         except TelegramError as e:
-            logger.error(f"Failed to send confirmation to {participant.full_name}: {e}")
+            logger.error("Failed to send confirmation to %s: %s", participant.full_name, e)
             return False
     
     async def send_decline_acknowledgment(self, participant: Participant) -> bool:
@@ -89,7 +93,7 @@ class NotificationManager:
             return True
             
         except TelegramError as e:
-            logger.error(f"Failed to send decline acknowledgment to {participant.full_name}: {e}")
+            logger.error("Failed to send decline acknowledgment to %s: %s", participant.full_name, e)
             return False
     
     async def send_escalation_alert(self, meeting_date: str) -> None:
@@ -100,49 +104,35 @@ class NotificationManager:
             logger.error("Config not found in bot_data")
             return
         
-        # Parse and format date
-        date_obj = parse_date(meeting_date)
-        formatted_date = format_date(date_obj) if date_obj else meeting_date
+        formatted_date = _display_date(meeting_date)
         
         message = MessageTemplates.escalation_alert(formatted_date)
         
-        # Send to all admins
-        for admin_id in config.admin_ids:
-            try:
-                await self.bot.send_message(
-                    chat_id=admin_id,
-                    text=message,
-                    parse_mode='Markdown'
-                )
-                logger.info(f"Escalation alert sent to admin {admin_id}")
-            except TelegramError as e:
-                logger.error(f"Failed to send escalation to admin {admin_id}: {e}")
+        # Send to all admins at once
+        results = await self.send_to_admins(config.admin_ids, message)
+        
+        for admin_id, error in results.items():
+            if error:
+                logger.error("Failed to send escalation to admin %s: %s", admin_id, error)
+            else:
+                logger.info("Escalation alert sent to admin %s", admin_id)
     
     async def send_reminder(self, participant: Participant, hours_remaining: int) -> bool:
         """Send reminder to participant about pending response"""
         try:
             message = MessageTemplates.timeout_warning(hours_remaining)
             
-            # Include response buttons again
-            keyboard = [
-                [
-                    InlineKeyboardButton("✅ Confirm", callback_data="confirm_duty"),
-                    InlineKeyboardButton("❌ Cannot", callback_data="decline_duty")
-                ]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
             await self.bot.send_message(
                 chat_id=participant.telegram_id,
                 text=message,
-                reply_markup=reply_markup,
+                reply_markup=_DUTY_KEYBOARD,
                 parse_mode='Markdown'
             )
             
             return True
             
         except TelegramError as e:
-            logger.error(f"Failed to send reminder to {participant.full_name}: {e}")
+            logger.error("Failed to send reminder to %s: %s", participant.full_name, e)
             return False
     
     async def notify_admins_of_confirmation(self, participant: Participant, meeting_date: str) -> None:
@@ -152,22 +142,46 @@ class NotificationManager:
         if not config:
             return
         
-        # Parse and format date
-        date_obj = parse_date(meeting_date)
-        formatted_date = format_date(date_obj) if date_obj else meeting_date
+        formatted_date = _display_date(meeting_date)
         
         message = (
             f"✅ **Duty Confirmed**\n\n"
             f"{participant.full_name} has confirmed happy hour duty for {formatted_date}"
         )
         
-        # Send to all admins
-        for admin_id in config.admin_ids:
-            try:
-                await self.bot.send_message(
-                    chat_id=admin_id,
-                    text=message,
-                    parse_mode='Markdown'
-                )
-            except TelegramError as e:
-                logger.error(f"Failed to notify admin {admin_id} of confirmation: {e}")
\ No newline at end of file
+        # Send to all admins at once
+        results = await self.send_to_admins(config.admin_ids, message)
+        
+        for admin_id, error in results.items():
+            if error:
+                logger.error("Failed to notify admin %s of confirmation: %s", admin_id, error)
+    
+    async def send_to_admins(self, admin_ids: Iterable[int], message: str,
+                             reply_markup: Optional[InlineKeyboardMarkup] = None) -> Dict[int, Optional[Exception]]:
+        """Send a Markdown message to every admin at once, returning each admin's error (None if delivered)"""
+        admin_ids = list(admin_ids)
+        
+        if not admin_ids:
+            logger.debug("No admins configured")
+            return {}
+        
+        # A single admin doesn't need gather's task overhead
+        if len(admin_ids) == 1:
+            return {admin_ids[0]: await self._send_to_admin(admin_ids[0], message, reply_markup)}
+        
+        results = await asyncio.gather(*(self._send_to_admin(admin_id, message, reply_markup) for admin_id in admin_ids))
+        return dict(zip(admin_ids, results))
+    
+    async def _send_to_admin(self, admin_id: int, message: str,
+                             reply_markup: Optional[InlineKeyboardMarkup] = None) -> Optional[Exception]:
+        """Send a Markdown message to one admin, returning the error instead of raising it"""
+        try:
+            await self.bot.send_message(
+                chat_id=admin_id,
+                text=message,
+                reply_markup=reply_markup,
+                parse_mode='Markdown'
+            )
+            return None
+        except Exception as e:
+            return e
\ No newline at end of file
@@ -2,7 +2,7 @@ import logging
 from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
 from src.database.db_manager import DatabaseManager
-from src.models.database_schema import Participant, Schedule
+from src.models.database_schema import Participant, Schedule, UserStatus
 from src.utils.datetime_utils import get_next_wednesday
 
 logger = logging.getLogger(__name__)
@@ -16,60 +16,78 @@ class RotationManager:
     def get_next_available_participant(self) -> Optional[Participant]:
         """
         Get the next available participant who hasn't been skipped this round
+        and move the rotation pointer to them
         Returns None if all participants have been exhausted
         """
         schedule = self.db_manager.get_schedule()
+        current_index = self._find_next_available_index(schedule)
         
+        if current_index is None:
+            return None
+        
+        # Update the pointer to this position
+        if current_index != schedule.next_pointer_index:
+            schedule.next_pointer_index = current_index
+            self.db_manager.patch_schedule(next_pointer_index=current_index)
+        
+        return self.db_manager.get_participant(schedule.rotation_list[current_index])
+    
+    def _peek_next_available_participant(self, schedule: Optional[Schedule] = None) -> Optional[Participant]:
+        """Get the next available participant without moving the rotation pointer"""
+        if schedule is None:
+            schedule = self.db_manager.get_schedule()
+        current_index = self._find_next_available_index(schedule)
+        
+        if current_index is None:
+            return None
+        
+        return self.db_manager.get_participant(schedule.rotation_list[current_index])
+    
+    def _find_next_available_index(self, schedule: Schedule) -> Optional[int]:
+        """Find the rotation index of the next non-skipped approved participant, or None if there is none"""
         if not schedule.rotation_list:
             logger.warning("No participants in rotation list")
             return None
         
-        # Get list of skipped participants this round
-        skipped = set(schedule.skipped_this_round)
-        
         # Check if all participants have been skipped
-        if len(skipped) >= len(schedule.rotation_list):
+        if self.db_manager.skipped_count() >= len(schedule.rotation_list):
             logger.warning("All participants have been exhausted for this round")
             return None
         
-        # Start from current pointer and find next non-skipped participant
+        # Start from current pointer and find next non-skipped approved participant,
+        # checking status through the database index
         start_index = schedule.next_pointer_index
-        checked_count = 0
+        rotation_size = len(schedule.rotation_list)
         
-        while checked_count < len(schedule.rotation_list):
-            current_index = (start_index + checked_count) % len(schedule.rotation_list)
+        for offset in range(rotation_size):
+            current_index = (start_index + offset) % rotation_size
             participant_id = schedule.rotation_list[current_index]
             
-            if participant_id not in skipped:
-                participant = self.db_manager.get_participant(participant_id)
-                if participant and participant.status == "approved":
-                    # Update the pointer to this position
-                    schedule.next_pointer_index = current_index
-                    self.db_manager.update_schedule(schedule)
-                    return participant
-            
-            checked_count += 1
+            if not self.db_manager.is_skipped(participant_id) and self.db_manager.has_status(participant_id, UserStatus.APPROVED):
+                return current_index
         
         return None
     
     def assign_duty(self, participant_id: int, meeting_date: Optional[str] = None) -> bool:
         """Assign duty to a specific participant"""
         if not meeting_date:
-            meeting_date = get_next_wednesday().strftime("%Y-%m-%d")
+            meeting_date = get_next_wednesday().date().isoformat()
         
         return self.db_manager.set_current_assignment(participant_id, meeting_date)
     
-    def skip_current_and_get_next(self) -> Optional[Participant]:
-        """Skip current assigned participant and get the next one"""
+    def skip_current_and_get_next(self) -> Tuple[Optional[Participant], Schedule]:
+        """Skip current assigned participant and get the next one, along with the schedule as read before the skip"""
         schedule = self.db_manager.get_schedule()
         
-        # Add current to skipped list
-        if schedule.current_assigned_id:
-            self.db_manager.add_skipped_participant(schedule.current_assigned_id)
-        
-        # Move pointer and get next
-        self.db_manager.move_to_next_participant()
-        return self.get_next_available_participant()
+        # Skip, advance and pick the next person in one write instead of three
+        with self.db_manager.schedule_transaction():
+            # Add current to skipped list
+            if schedule.current_assigned_id:
+                self.db_manager.add_skipped_participant(schedule.current_assigned_id)
+            
+            # Move pointer and get next
+            self.db_manager.move_to_next_participant()
+            return self.get_next_available_participant(), schedule
     
     def is_rotation_exhausted(self) -> bool:
         """Check if all participants have been skipped/declined"""
@@ -78,7 +96,7 @@ class RotationManager:
         if not schedule.rotation_list:
             return True
         
-        return len(schedule.skipped_this_round) >= len(schedule.rotation_list)
+        return self.db_manager.skipped_count() >= len(schedule.rotation_list)
     
     def reset_round(self):
         """Reset the skipped list for a new round (after confirmation)"""
@@ -104,7 +122,8 @@ class RotationManager:
             if current:
                 status["current_assigned"] = current.full_name
         
-        next_participant = self.get_next_available_participant()
+        # Peek so a status read never moves the rotation pointer
+        next_participant = self._peek_next_available_participant(schedule)
         if next_participant:
             status["next_in_line"] = next_participant.full_name
         
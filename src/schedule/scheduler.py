@@ -1,18 +1,27 @@
 import logging
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Any
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.triggers.cron import CronTrigger
 from telegram.ext import Application
 from src.config import BotConfig
 from src.database.db_manager import DatabaseManager
+from src.models.database_schema import Schedule
 from src.schedule.rotation_manager import RotationManager
 from src.notifications.notifier import NotificationManager
 from src.utils.datetime_utils import parse_time, get_next_wednesday
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=16)
+def _cron(day_of_week: str, hour: int, minute: int, tz: str) -> CronTrigger:
+    """Build a cron trigger once per schedule; triggers hold no run state, so jobs can share them"""
+    return CronTrigger(day_of_week=day_of_week, hour=hour, minute=minute, timezone=tz)
+
 class WeeklyScheduler:
     """Manages weekly notification scheduling"""
     
@@ -22,23 +31,34 @@ class WeeklyScheduler:
         self.db_manager = db_manager
         self.rotation_manager = RotationManager(db_manager)
         self.notification_manager = NotificationManager(application, db_manager)
-        self.scheduler = AsyncIOScheduler(timezone=config.timezone)
-        self.timeout_tasks: Dict[int, asyncio.Task] = {}
+        # Run a late job once rather than once per missed tick, and never two copies of it at a time
+        self.scheduler = AsyncIOScheduler(
+            timezone=config.timezone,
+            job_defaults={'coalesce': True, 'misfire_grace_time': 60, 'max_instances': 1}
+        )
+        # When the current pending assignment runs out, on the time.monotonic() clock so wall-clock
+        # jumps don't move it; None when nothing is awaiting a response
+        self._pending_deadline: Optional[float] = None
+        # Pending-assignment poll interval, backed off while idle and reset when an assignment starts
+        self._poll_interval_minutes = config.min_poll_interval_minutes
+        # Held by every job that changes the current assignment (weekly run, pending poll, response timeout)
+        # so none of them can interleave with another and act on the same assignment twice
+        self._assignment_lock = asyncio.Lock()
     
     async def initialize(self):
         """Initialize the scheduler and set up weekly notifications"""
         # Parse notification time
         notification_time = parse_time(self.config.notification_time)
         if not notification_time:
-            logger.error(f"Invalid notification time: {self.config.notification_time}")
+            logger.error("Invalid notification time: %s", self.config.notification_time)
             return
         
         # Schedule weekly notification (every Thursday by default)
-        trigger = CronTrigger(
-            day_of_week='thu',  # Thursday
-            hour=notification_time.hour,
-            minute=notification_time.minute,
-            timezone=self.config.timezone
+        trigger = _cron(
+            'thu',  # Thursday
+            notification_time.hour,
+            notification_time.minute,
+            self.config.timezone
         )
         
         self.scheduler.add_job(
@@ -48,108 +68,99 @@ class WeeklyScheduler:
             replace_existing=True
         )
         
-        # Check for any pending assignments on startup
-        self.scheduler.add_job(
-            self.check_pending_assignments,
-            'interval',
-            minutes=30,  # Check every 30 minutes
-            id='pending_check',
-            replace_existing=True
-        )
-        
         self.scheduler.start()
-        logger.info(f"Scheduler initialized. Weekly notifications on Thursday at {self.config.notification_time}")
+        logger.info("Scheduler initialized. Weekly notifications on Thursday at %s", self.config.notification_time)
         
-        # Run initial check
+        # Pick up any assignment left pending from before a restart, then run initial check,
+        # which also schedules the next one
+        self.refresh_pending_deadline()
         await self.check_pending_assignments()
     
     async def weekly_notification_job(self):
         """Job that runs weekly to send notifications"""
-        logger.info("Running weekly notification job")
-        
-        try:
-            # Get next available participant
-            participant = self.rotation_manager.get_next_available_participant()
-            
-            if not participant:
-                # All participants exhausted - escalate
-                await self.escalate_to_admins()
-                return
-            
-            # Set meeting date (next Wednesday)
-            meeting_date = get_next_wednesday()
-            
-            # Assign duty
-            self.rotation_manager.assign_duty(participant.telegram_id, meeting_date.strftime("%Y-%m-%d"))
+        async with self._assignment_lock:
+            logger.info("Running weekly notification job")
             
-            # Send notification
-            success = await self.notification_manager.send_duty_notification(
-                participant,
-                meeting_date.strftime("%Y-%m-%d")
-            )
+            try:
+                # Get next available participant
+                participant = await asyncio.to_thread(self.rotation_manager.get_next_available_participant)
+                
+                if not participant:
+                    # All participants exhausted - escalate
+                    await self.escalate_to_admins()
+                    return
+                
+                # Set meeting date (next Wednesday)
+                meeting_date = get_next_wednesday().date().isoformat()
+                
+                # Assign duty
+                await asyncio.to_thread(self.rotation_manager.assign_duty, participant.telegram_id, meeting_date)
+                self.refresh_pending_deadline()
+                
+                # Send notification
+                success = await self.notification_manager.send_duty_notification(
+                    participant,
+                    meeting_date
+                )
+                
+                if success:
+                    # Start timeout timer
+                    await self.start_response_timeout(participant.telegram_id)
+                    logger.info("Weekly notification sent to %s", participant.full_name)
+                else:
+                    logger.error("Failed to send notification to %s", participant.full_name)
+                    # Try next participant
+                    await self.handle_notification_failure(participant.telegram_id)
             
-            if success:
-                # Start timeout timer
-                await self.start_response_timeout(participant.telegram_id)
-                logger.info(f"Weekly notification sent to {participant.full_name}")
-            else:
-                logger.error(f"Failed to send notification to {participant.full_name}")
-                # Try next participant
-                await self.handle_notification_failure(participant.telegram_id)
-        
-        except Exception as e:
-            logger.error(f"Error in weekly notification job: {e}", exc_info=True)
+            except Exception as e:
+                logger.error("Error in weekly notification job: %s", e, exc_info=True)
     
     async def start_response_timeout(self, user_id: int):
         """Start timeout timer for user response"""
-        # Cancel existing timeout if any
-        if user_id in self.timeout_tasks:
-            self.timeout_tasks[user_id].cancel()
-        
-        # Create new timeout task
-        timeout_task = asyncio.create_task(
-            self.handle_response_timeout(user_id)
+        # One-shot job per user; replacing it also cancels any existing timeout
+        self.scheduler.add_job(
+            self.handle_response_timeout,
+            'date',
+            run_date=datetime.now(timezone.utc) + timedelta(hours=self.config.response_window_hours),
+            args=[user_id],
+            id=f'timeout_{user_id}',
+            replace_existing=True,
+            misfire_grace_time=None  # A late timeout must still fire
         )
-        self.timeout_tasks[user_id] = timeout_task
     
     async def handle_response_timeout(self, user_id: int):
         """Handle timeout when user doesn't respond within window"""
-        try:
-            # Wait for response window
-            await asyncio.sleep(self.config.response_window_hours * 3600)
+        async with self._assignment_lock:
+            try:
+                # Check if assignment is still pending
+                schedule = self.db_manager.get_schedule()
+                if schedule.current_assigned_id == user_id and schedule.assignment_status == "pending":
+                    logger.info("Response timeout for user %s", user_id)
+                    
+                    # Mark as skipped and try next person
+                    await self.handle_decline(user_id)
             
-            # Check if assignment is still pending
-            schedule = self.db_manager.get_schedule()
-            if schedule.current_assigned_id == user_id and schedule.assignment_status == "pending":
-                logger.info(f"Response timeout for user {user_id}")
-                
-                # Mark as skipped and try next person
-                await self.handle_decline(user_id)
-        
-        except asyncio.CancelledError:
-            # Timeout was cancelled (user responded)
-            pass
-        except Exception as e:
-            logger.error(f"Error handling timeout for user {user_id}: {e}")
+            except Exception as e:
+                logger.error("Error handling timeout for user %s: %s", user_id, e)
     
     async def handle_decline(self, user_id: int):
         """Handle when a user declines or times out"""
-        logger.info(f"Handling decline/timeout for user {user_id}")
+        logger.info("Handling decline/timeout for user %s", user_id)
         
         # Get next participant
-        next_participant = self.rotation_manager.skip_current_and_get_next()
+        next_participant, schedule = await asyncio.to_thread(self.rotation_manager.skip_current_and_get_next)
         
         if not next_participant:
             # All exhausted - escalate
-            await self.escalate_to_admins()
+            await self.escalate_to_admins(schedule)
             return
         
-        # Get current meeting date
-        schedule = self.db_manager.get_schedule()
-        meeting_date = schedule.next_meeting_date or get_next_wednesday().strftime("%Y-%m-%d")
+        # Get current meeting date (skipping doesn't change it, so the schedule read by the skip still holds it)
+        meeting_date = self._meeting_date(schedule)
         
         # Assign to next person
-        self.rotation_manager.assign_duty(next_participant.telegram_id, meeting_date)
+        await asyncio.to_thread(self.rotation_manager.assign_duty, next_participant.telegram_id, meeting_date)
+        self.refresh_pending_deadline()
         
         # Send notification
         success = await self.notification_manager.send_duty_notification(
@@ -165,46 +176,91 @@ class WeeklyScheduler:
     
     async def handle_notification_failure(self, user_id: int):
         """Handle when notification fails to send"""
-        logger.warning(f"Notification failed for user {user_id}, trying next")
+        logger.warning("Notification failed for user %s, trying next", user_id)
         await self.handle_decline(user_id)
     
-    async def escalate_to_admins(self):
+    async def escalate_to_admins(self, schedule: Optional[Schedule] = None):
         """Send escalation alert to all admins"""
-        schedule = self.db_manager.get_schedule()
-        meeting_date = schedule.next_meeting_date or get_next_wednesday().strftime("%Y-%m-%d")
+        meeting_date = self._meeting_date(schedule or self.db_manager.get_schedule())
         
         await self.notification_manager.send_escalation_alert(meeting_date)
-        logger.warning(f"Escalated to admins - no one available for {meeting_date}")
+        logger.warning("Escalated to admins - no one available for %s", meeting_date)
+    
+    @staticmethod
+    def _meeting_date(schedule: Schedule) -> str:
+        """Get the scheduled meeting date, falling back to next Wednesday when none is set"""
+        return schedule.next_meeting_date or get_next_wednesday().date().isoformat()
+    
+    def refresh_pending_deadline(self):
+        """Recompute the cached response deadline from the current assignment in the database"""
+        schedule = self.db_manager.get_schedule()
+        
+        if schedule.current_assigned_id and schedule.assignment_status == "pending" and schedule.last_assignment_date:
+            # The persisted wall-clock time is only converted here; polls compare monotonic times
+            assignment_time = datetime.fromisoformat(schedule.last_assignment_date)
+            deadline = assignment_time + timedelta(hours=self.config.response_window_hours)
+            self._pending_deadline = time.monotonic() + (deadline - datetime.now()).total_seconds()
+            
+            # Work has arrived: go back to polling at the fastest interval
+            if self._poll_interval_minutes != self.config.min_poll_interval_minutes:
+                self._poll_interval_minutes = self.config.min_poll_interval_minutes
+                if self.scheduler.running:
+                    self._schedule_next_poll()
+        else:
+            self._pending_deadline = None
+    
+    def _schedule_next_poll(self):
+        """Schedule the next pending-assignment check as a one-shot job after the current interval"""
+        self.scheduler.add_job(
+            self.check_pending_assignments,
+            'date',
+            run_date=datetime.now(timezone.utc) + timedelta(minutes=self._poll_interval_minutes),
+            id='pending_check',
+            replace_existing=True,
+            misfire_grace_time=None  # Each poll schedules the next, so a late one must still run
+        )
     
     async def check_pending_assignments(self):
         """Check for any pending assignments that need attention"""
-        try:
-            schedule = self.db_manager.get_schedule()
+        async with self._assignment_lock:
+            try:
+                now = time.monotonic()
+                
+                # Nothing pending, or not overdue yet: no need to touch the database
+                if self._pending_deadline is None or now <= self._pending_deadline:
+                    return
+                
+                # Re-check against the database in case the assignment changed since the deadline was cached
+                self.refresh_pending_deadline()
+                
+                if self._pending_deadline is not None and now > self._pending_deadline:
+                    logger.info("Found overdue assignment, handling timeout")
+                    await self.handle_decline(self.db_manager.get_schedule().current_assigned_id)
             
-            if schedule.current_assigned_id and schedule.assignment_status == "pending":
-                # Check if assignment is overdue
-                if schedule.last_assignment_date:
-                    assignment_time = datetime.fromisoformat(schedule.last_assignment_date)
-                    deadline = assignment_time + timedelta(hours=self.config.response_window_hours)
-                    
-                    if datetime.now() > deadline:
-                        logger.info("Found overdue assignment, handling timeout")
-                        await self.handle_decline(schedule.current_assigned_id)
-        
-        except Exception as e:
-            logger.error(f"Error checking pending assignments: {e}")
+            except Exception as e:
+                logger.error("Error checking pending assignments: %s", e)
+            
+            finally:
+                # Back off while idle, stay at the fastest interval while a response is awaited
+                if self._pending_deadline is None:
+                    self._poll_interval_minutes = min(
+                        self._poll_interval_minutes * self.config.poll_backoff_factor,
+                        self.config.max_poll_interval_minutes
+                    )
+                else:
+                    self._poll_interval_minutes = self.config.min_poll_interval_minutes
+                self._schedule_next_poll()
     
     def cancel_timeout(self, user_id: int):
         """Cancel timeout for a user who has responded"""
-        if user_id in self.timeout_tasks:
-            self.timeout_tasks[user_id].cancel()
-            del self.timeout_tasks[user_id]
+        self._pending_deadline = None
+        
+        try:
+            self.scheduler.remove_job(f'timeout_{user_id}')
+        except JobLookupError:
+            # Already fired or never started
+            pass
     
     def shutdown(self):
-        """Shutdown the scheduler"""
-        self.scheduler.shutdown()
-        
-        # Cancel all timeout tasks
-        for task in self.timeout_tasks.values():
-            task.cancel()
-        self.timeout_tasks.clear()
\ No newline at end of file
+        """Shutdown the scheduler (pending timeout jobs go with it)"""
+        self.scheduler.shutdown()
\ No newline at end of file
@@ -1,31 +1,29 @@
-from datetime import datetime, timedelta, time
+from datetime import datetime, timedelta, time, timezone, tzinfo
+from functools import lru_cache
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+def _days_until_weekday(target_weekday: int, weekday: int) -> int:
+    """Days from weekday to the next target_weekday, always 1-7 (a same-day target means next week)"""
+    return (target_weekday - weekday - 1) % 7 + 1
+
+def _next_weekday(target_weekday: int, now: Optional[datetime] = None) -> datetime:
+    """Get the next given weekday after now (0=Monday, ..., 6=Sunday)"""
+    now = now or datetime.now()
+    return now + timedelta(days=_days_until_weekday(target_weekday, now.weekday()))
 
 def get_next_wednesday() -> datetime:
     """Get the next Wednesday from today"""
-    today = datetime.now()
-    days_ahead = 2 - today.weekday()  # Wednesday is 2
-    
-    if days_ahead <= 0:  # Target day already happened this week
-        days_ahead += 7
-    
-    return today + timedelta(days=days_ahead)
+    return _next_weekday(2)  # Wednesday is 2
 
 def get_next_thursday() -> datetime:
     """Get the next Thursday from today"""
-    today = datetime.now()
-    days_ahead = 3 - today.weekday()  # Thursday is 3
-    
-    if days_ahead <= 0:  # Target day already happened this week
-        days_ahead += 7
-    
-    return today + timedelta(days=days_ahead)
+    return _next_weekday(3)  # Thursday is 3
 
 def parse_date(date_str: str) -> Optional[datetime]:
     """Parse date string in YYYY-MM-DD format"""
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
+        return datetime.fromisoformat(date_str)
     except ValueError:
         return None
 
@@ -33,38 +31,40 @@ def format_date(date_obj: datetime) -> str:
     """Format date as readable string"""
     return date_obj.strftime("%A, %B %d, %Y")
 
+@lru_cache(maxsize=16)
 def parse_time(time_str: str) -> Optional[time]:
-    """Parse time string in HH:MM format"""
+    """Parse time string in HH:MM format, cached since it only ever sees config values"""
     try:
         hour, minute = map(int, time_str.split(':'))
         return time(hour, minute)
     except (ValueError, AttributeError):
         return None
 
-def get_timezone(timezone_str: str) -> pytz.timezone:
-    """Get timezone object from string"""
+@lru_cache(maxsize=64)
+def get_timezone(timezone_str: str) -> tzinfo:
+    """Get timezone object from string, cached per name (unknown names cache the UTC fallback)"""
     try:
-        return pytz.timezone(timezone_str)
-    except pytz.exceptions.UnknownTimeZoneError:
-        return pytz.UTC
+        return ZoneInfo(timezone_str)
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
 
 def localize_datetime(dt: datetime, timezone_str: str) -> datetime:
     """Localize datetime to specified timezone"""
     tz = get_timezone(timezone_str)
     if dt.tzinfo is None:
-        return tz.localize(dt)
+        return dt.replace(tzinfo=tz)
     else:
         return dt.astimezone(tz)
 
-def is_within_hours(start_time: datetime, hours: int) -> bool:
-    """Check if current time is within specified hours from start_time"""
-    now = datetime.now()
+def is_within_hours(start_time: datetime, hours: int, now: Optional[datetime] = None) -> bool:
+    """Check if current time (or the given now) is within specified hours from start_time"""
+    now = now or datetime.now()
     deadline = start_time + timedelta(hours=hours)
     return now <= deadline
 
-def hours_until_deadline(start_time: datetime, total_hours: int) -> float:
-    """Calculate hours remaining until deadline"""
-    now = datetime.now()
+def hours_until_deadline(start_time: datetime, total_hours: int, now: Optional[datetime] = None) -> float:
+    """Calculate hours remaining until deadline, measured from now unless given"""
+    now = now or datetime.now()
     deadline = start_time + timedelta(hours=total_hours)
     remaining = deadline - now
     
@@ -73,19 +73,20 @@ def hours_until_deadline(start_time: datetime, total_hours: int) -> float:
     
     return remaining.total_seconds() / 3600
 
-def next_occurrence_of_time(target_time: time, target_weekday: Optional[int] = None) -> datetime:
+def next_occurrence_of_time(target_time: time, target_weekday: Optional[int] = None, now: Optional[datetime] = None) -> datetime:
     """
     Get the next occurrence of a specific time
     target_weekday: 0=Monday, 1=Tuesday, ..., 6=Sunday
+    now: reference time, defaults to the current time
     """
-    now = datetime.now()
+    now = now or datetime.now()
     target = datetime.combine(now.date(), target_time)
     
     if target_weekday is not None:
-        # Find next occurrence of the target weekday
-        days_ahead = target_weekday - now.weekday()
-        if days_ahead < 0 or (days_ahead == 0 and now.time() > target_time):
-            days_ahead += 7
+        # Find next occurrence of the target weekday, which is today if the time hasn't passed yet
+        days_ahead = _days_until_weekday(target_weekday, now.weekday())
+        if days_ahead == 7 and now.time() <= target_time:
+            days_ahead = 0
         target += timedelta(days=days_ahead)
     else:
         # If time has passed today, move to tomorrow
@@ -3,6 +3,29 @@ import os
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 
+# Formatters are stateless, so every setup_logging() call shares these
+_DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+_SIMPLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+class DelayedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates the log directory and opens the file on the first record"""
+    
+    def __init__(self, filename: str, **kwargs):
+        kwargs['delay'] = True
+        super().__init__(filename, **kwargs)
+    
+    def _open(self):
+        # exist_ok covers another process creating the directory first
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
 def setup_logging(log_level: str = "INFO", log_file: str = None):
     """
     Set up logging configuration for the bot
@@ -11,45 +34,35 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
     """
-    # Create logs directory if needed
-    if log_file:
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-    
-    # Set up formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Neither formatter shows thread or process info, so skip collecting it for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
-    simple_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    level = getattr(logging, log_level.upper(), logging.INFO)
     
     # Get root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    root_logger.setLevel(level)
     
     # Clear existing handlers
     root_logger.handlers.clear()
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper(), logging.INFO))
-    console_handler.setFormatter(simple_formatter)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(_SIMPLE_FORMATTER)
     root_logger.addHandler(console_handler)
     
-    # File handler (if specified)
+    # File handler (if specified); the directory and file are only created once something is logged
     if log_file:
-        file_handler = RotatingFileHandler(
+        file_handler = DelayedRotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5
         )
         file_handler.setLevel(logging.DEBUG)  # Log everything to file
-        file_handler.setFormatter(detailed_formatter)
+        file_handler.setFormatter(_DETAILED_FORMATTER)
         root_logger.addHandler(file_handler)
     
     # Reduce noise from external libraries
@@ -67,25 +80,37 @@ class BotLogger:
     
     def log_user_action(self, user_id: int, action: str, details: str = None):
         """Log user actions with consistent format"""
-        message = f"User {user_id} - {action}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         if details:
-            message += f" - {details}"
-        self.logger.info(message)
+            self.logger.info("User %s - %s - %s", user_id, action, details)
+        else:
+            self.logger.info("User %s - %s", user_id, action)
     
     def log_admin_action(self, admin_id: int, action: str, target: str = None):
         """Log admin actions"""
-        message = f"Admin {admin_id} - {action}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         if target:
-            message += f" - Target: {target}"
-        self.logger.info(message)
+            self.logger.info("Admin %s - %s - Target: %s", admin_id, action, target)
+        else:
+            self.logger.info("Admin %s - %s", admin_id, action)
     
     def log_notification(self, user_id: int, notification_type: str, status: str):
         """Log notification events"""
-        self.logger.info(f"Notification - Type: {notification_type}, User: {user_id}, Status: {status}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        self.logger.info("Notification - Type: %s, User: %s, Status: %s", notification_type, user_id, status)
     
     def log_error(self, error: Exception, context: str = None):
         """Log errors with context"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         if context:
-            self.logger.error(f"{context}: {str(error)}", exc_info=True)
+            self.logger.error("%s: %s", context, error, exc_info=True)
         else:
-            self.logger.error(str(error), exc_info=True)
\ No newline at end of file
+            self.logger.error("%s", error, exc_info=True)
\ No newline at end of file
@@ -1,16 +1,49 @@
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 
 class MessageTemplates:
     """Centralized message templates for bot communications"""
     
+    # Section headers for the admin status page
+    ROTATION_HEADER = "\n\n**📋 Full Rotation Order:**\n"
+    SKIPPED_HEADER = "\n**⏭️ Skipped This Round:**\n"
+    
+    # Fixed messages, built once at import
+    WELCOME_MESSAGE = (
+        "Welcome to the Happy Hour Duty Bot! 🎉\n\n"
+        "To get started, please tell me your full name.\n"
+        "This will be used to identify you in the rotation schedule."
+    )
+    APPROVAL_NOTIFICATION = (
+        "🎉 **Great news!**\n\n"
+        "Your registration has been approved!\n"
+        "You've been added to the Happy Hour Duty list.\n\n"
+        "You'll receive a notification when it's your turn to bring refreshments."
+    )
+    REJECTION_NOTIFICATION = (
+        "Unfortunately, your registration has been rejected.\n\n"
+        "If you believe this is an error, please contact an administrator."
+    )
+    INACTIVE_ACCOUNT = "Your account is currently inactive. Please contact an admin."
+    
+    # Greeting for an already registered user, keyed by status; other statuses get INACTIVE_ACCOUNT
+    _REGISTERED_BY_STATUS = {
+        "approved": (
+            "👋 Hello {name}!\n\n"
+            "You're already registered and approved for Happy Hour Duty.\n"
+            "You'll receive notifications when it's your turn."
+        ),
+        "pending": (
+            "Hello {name}!\n\n"
+            "Your registration is pending admin approval.\n"
+            "You'll be notified once an admin reviews your request."
+        ),
+    }
+    
     @staticmethod
     def welcome_message() -> str:
-        return (
-            "Welcome to the Happy Hour Duty Bot! 🎉\n\n"
-            "To get started, please tell me your full name.\n"
-            "This will be used to identify you in the rotation schedule."
-        )
+        return MessageTemplates.WELCOME_MESSAGE
     
     @staticmethod
     def registration_submitted(name: str) -> str:
@@ -22,22 +55,11 @@ class MessageTemplates:
     
     @staticmethod
     def already_registered(name: str, status: str) -> str:
-        if status == "approved":
-            return (
-                f"👋 Hello {name}!\n\n"
-                "You're already registered and approved for Happy Hour Duty.\n"
-                "You'll receive notifications when it's your turn."
-            )
-        elif status == "pending":
-            return (
-                f"Hello {name}!\n\n"
-                "Your registration is pending admin approval.\n"
-                "You'll be notified once an admin reviews your request."
-            )
-        else:
-            return "Your account is currently inactive. Please contact an admin."
+        template = MessageTemplates._REGISTERED_BY_STATUS.get(str(status))
+        return template.format(name=name) if template else MessageTemplates.INACTIVE_ACCOUNT
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def duty_notification(name: str, meeting_date: str) -> str:
         return (
             f"🔔 **Happy Hour Duty Reminder**\n\n"
@@ -85,21 +107,14 @@ class MessageTemplates:
     
     @staticmethod
     def approval_notification() -> str:
-        return (
-            "🎉 **Great news!**\n\n"
-            "Your registration has been approved!\n"
-            "You've been added to the Happy Hour Duty list.\n\n"
-            "You'll receive a notification when it's your turn to bring refreshments."
-        )
+        return MessageTemplates.APPROVAL_NOTIFICATION
     
     @staticmethod
     def rejection_notification() -> str:
-        return (
-            "Unfortunately, your registration has been rejected.\n\n"
-            "If you believe this is an error, please contact an administrator."
-        )
+        return MessageTemplates.REJECTION_NOTIFICATION
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def timeout_warning(hours_remaining: int) -> str:
         return (
             f"⏰ **Reminder**\n\n"
@@ -112,28 +127,18 @@ class MessageTemplates:
         if not participants:
             return "No participants found."
         
-        text = "**Participant List:**\n\n"
-        for i, p in enumerate(participants, 1):
-            text += f"{i}. {p.full_name} (ID: {p.telegram_id}) - Status: {p.status}\n"
-        return text
+        lines = ["**Participant List:**\n\n"]
+        lines.extend(
+            f"{i}. {p.full_name} (ID: {p.telegram_id}) - Status: {p.status}\n"
+            for i, p in enumerate(participants, 1)
+        )
+        return "".join(lines)
     
     @staticmethod
     def format_rotation_status(current_assigned: Optional[str], next_person: Optional[str], meeting_date: Optional[str]) -> str:
-        text = "**📊 Rotation Status**\n\n"
-        
-        if current_assigned:
-            text += f"**Currently Assigned:** {current_assigned}\n"
-        else:
-            text += "**Currently Assigned:** None\n"
-        
-        if meeting_date:
-            text += f"**Meeting Date:** {meeting_date}\n"
-        else:
-            text += "**Meeting Date:** Not set\n"
-        
-        if next_person:
-            text += f"**Next in Line:** {next_person}\n"
-        else:
-            text += "**Next in Line:** Rotation list empty\n"
-        
-        return text
\ No newline at end of file
+        return (
+            "**📊 Rotation Status**\n\n"
+            f"**Currently Assigned:** {current_assigned or 'None'}\n"
+            f"**Meeting Date:** {meeting_date or 'Not set'}\n"
+            f"**Next in Line:** {next_person or 'Rotation list empty'}\n"
+        )
\ No newline at end of file
@@ -0,0 +1,172 @@
+import os
+import orjson
+import pytest
+from src.database import db_manager as db_module
+from src.database.db_manager import DatabaseManager
+from src.models.database_schema import Participant, UserStatus
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseManager(str(tmp_path / "db.json"))
+
+@pytest.fixture
+def replace_calls(monkeypatch):
+    """Count the file swaps, i.e. the writes that actually reach the disk"""
+    calls = []
+    real_replace = os.replace
+
+    def counting_replace(src, dst):
+        calls.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(db_module.os, "replace", counting_replace)
+    return calls
+
+def read_disk(db):
+    with open(db.db_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def approve(db, telegram_id, name=None):
+    db.add_participant(Participant(telegram_id, name or f"user{telegram_id}"))
+    participant = db.get_participant(telegram_id)
+    participant.status = UserStatus.APPROVED
+    assert db.update_participant(participant)
+
+def test_status_index_follows_status_changes(db):
+    db.add_participant(Participant(1, "Alice"))
+    db.add_participant(Participant(2, "Bob"))
+    approve(db, 3)
+
+    assert [p.telegram_id for p in db.get_pending_participants()] == [1, 2]
+    assert [p.telegram_id for p in db.get_approved_participants()] == [3]
+    assert db.has_status(1, UserStatus.PENDING)
+
+    participant = db.get_participant(1)
+    participant.status = UserStatus.INACTIVE
+    db.update_participant(participant)
+
+    assert not db.has_status(1, UserStatus.PENDING)
+    assert db.has_status(1, UserStatus.INACTIVE)
+    assert [p.telegram_id for p in db.get_pending_participants()] == [2]
+
+    db.remove_participant(2)
+    assert db.get_pending_participants() == []
+    assert db.get_participant(2) is None
+
+def test_approval_adds_to_rotation_once(db):
+    approve(db, 1)
+    db.update_participant(db.get_participant(1))
+
+    assert db.get_schedule().rotation_list == [1]
+
+def test_returned_participants_do_not_alias_the_cache(db):
+    db.add_participant(Participant(1, "Alice"))
+
+    participant = db.get_participant(1)
+    participant.status = UserStatus.APPROVED
+
+    assert db.get_participant(1).status is UserStatus.PENDING
+    assert db.has_status(1, UserStatus.PENDING)
+
+def test_update_participant_expected_status_is_compare_and_set(db):
+    db.add_participant(Participant(1, "Alice"))
+    first = db.get_participant(1)
+    second = db.get_participant(1)
+    first.status = UserStatus.APPROVED
+    second.status = UserStatus.INACTIVE
+
+    assert db.update_participant(first, UserStatus.PENDING)
+    assert not db.update_participant(second, UserStatus.PENDING)
+    assert db.get_participant(1).status is UserStatus.APPROVED
+
+def test_schedule_transaction_writes_once_at_the_end(db, replace_calls):
+    for telegram_id in (1, 2, 3):
+        approve(db, telegram_id)
+    replace_calls.clear()
+
+    with db.schedule_transaction():
+        db.add_skipped_participant(1)
+        db.move_to_next_participant()
+
+        # Visible in memory right away, but nothing reaches the disk before the block ends
+        assert db.is_skipped(1)
+        assert replace_calls == []
+        assert read_disk(db)["schedule"]["skipped_this_round"] == []
+
+    assert len(replace_calls) == 1
+    schedule = read_disk(db)["schedule"]
+    assert schedule["skipped_this_round"] == [1]
+    assert schedule["next_pointer_index"] == 1
+
+def test_external_edit_is_picked_up(db):
+    db.add_participant(Participant(1, "Alice"))
+
+    data = read_disk(db)
+    data["participants"]["1"]["full_name"] = "Alicia"
+    with open(db.db_path, 'wb') as f:
+        f.write(orjson.dumps(data))
+    # Make sure the mtime moves even on filesystems with coarse timestamps
+    stat = os.stat(db.db_path)
+    os.utime(db.db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert db.get_participant(1).full_name == "Alicia"
+
+def test_own_writes_do_not_trigger_a_reload(db, monkeypatch):
+    loads = []
+    real_load = db._load
+    monkeypatch.setattr(db, "_load", lambda: (loads.append(1), real_load()))
+
+    db.add_participant(Participant(1, "Alice"))
+    db.get_participant(1)
+
+    assert loads == []
+
+def test_writes_survive_a_restart(db):
+    approve(db, 1)
+    db.set_current_assignment(1, "2026-10-21")
+
+    reopened = DatabaseManager(db.db_path)
+    assert reopened.get_participant(1).status is UserStatus.APPROVED
+    assert reopened.get_schedule().current_assigned_id == 1
+
+def test_confirm_assignment_advances_pointer_once(db, replace_calls):
+    for telegram_id in (1, 2, 3):
+        approve(db, telegram_id)
+    db.set_current_assignment(1, "2026-10-21")
+    db.add_skipped_participant(3)
+    replace_calls.clear()
+
+    assert not db.confirm_assignment(2)
+    assert db.confirm_assignment(1)
+    assert len(replace_calls) == 1
+
+    schedule = db.get_schedule()
+    assert schedule.assignment_status == "confirmed"
+    assert schedule.skipped_this_round == []
+    assert schedule.next_pointer_index == 1
+    assert not db.is_skipped(3)
+
+    # A repeated confirmation changes nothing
+    assert not db.confirm_assignment(1)
+    assert db.get_schedule().next_pointer_index == 1
+
+def test_record_decline_skips_once_and_marks_searching(db, replace_calls):
+    approve(db, 1)
+    db.set_current_assignment(1, "2026-10-21")
+    replace_calls.clear()
+
+    schedule = db.record_decline(1)
+    db.record_decline(1)
+
+    assert schedule.assignment_status == "searching"
+    assert schedule.skipped_this_round == [1]
+    assert db.skipped_count() == 1
+    assert len(replace_calls) == 2
+    assert read_disk(db)["schedule"]["skipped_this_round"] == [1]
+
+def test_patch_schedule_resyncs_membership_sets(db):
+    db.patch_schedule(rotation_list=[4, 5], skipped_this_round=[5])
+
+    assert db._rotation_set == {4, 5}
+    assert db.is_skipped(5)
+    assert db.skipped_count() == 1
\ No newline at end of file
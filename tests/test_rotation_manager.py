@@ -0,0 +1,68 @@
+import os
+import pytest
+from src.database import db_manager as db_module
+from src.database.db_manager import DatabaseManager
+from src.models.database_schema import Participant, UserStatus
+from src.schedule.rotation_manager import RotationManager
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    for telegram_id in (1, 2, 3):
+        db.add_participant(Participant(telegram_id, f"user{telegram_id}"))
+        participant = db.get_participant(telegram_id)
+        participant.status = UserStatus.APPROVED
+        db.update_participant(participant)
+    return db
+
+@pytest.fixture
+def rotation(db):
+    return RotationManager(db)
+
+def test_skip_current_and_get_next_returns_next_and_schedule(db, rotation):
+    first = rotation.get_next_available_participant()
+    rotation.assign_duty(first.telegram_id, "2026-10-21")
+
+    next_participant, schedule = rotation.skip_current_and_get_next()
+
+    assert first.telegram_id == 1
+    assert next_participant.telegram_id == 2
+    assert schedule.next_meeting_date == "2026-10-21"
+
+    stored = db.get_schedule()
+    assert stored.skipped_this_round == [1]
+    assert stored.next_pointer_index == 1
+
+def test_skip_current_and_get_next_writes_once(db, rotation, monkeypatch):
+    rotation.assign_duty(1, "2026-10-21")
+
+    calls = []
+    real_replace = os.replace
+    monkeypatch.setattr(db_module.os, "replace", lambda src, dst: (calls.append(dst), real_replace(src, dst)))
+
+    rotation.skip_current_and_get_next()
+
+    assert len(calls) == 1
+
+def test_skip_current_and_get_next_passes_over_skipped_and_unapproved(db, rotation):
+    participant = db.get_participant(2)
+    participant.status = UserStatus.INACTIVE
+    db.update_participant(participant)
+    rotation.assign_duty(1, "2026-10-21")
+
+    next_participant, _ = rotation.skip_current_and_get_next()
+
+    assert next_participant.telegram_id == 3
+
+def test_skip_current_and_get_next_exhausts_the_round(db, rotation):
+    for telegram_id in (1, 2):
+        rotation.assign_duty(telegram_id, "2026-10-21")
+        next_participant, _ = rotation.skip_current_and_get_next()
+        assert next_participant is not None
+
+    rotation.assign_duty(3, "2026-10-21")
+    next_participant, schedule = rotation.skip_current_and_get_next()
+
+    assert next_participant is None
+    assert schedule.next_meeting_date == "2026-10-21"
+    assert rotation.is_rotation_exhausted()
\ No newline at end of file